@@ -9,13 +9,22 @@ from .engineering import (
     compute_overturning_moment,
     compute_tension_demand,
     compute_cumulative_tension,
+    compute_cumulative_tension_arr,
+    compute_rod_run_tensions,
     compute_wood_shrinkage,
     compute_rod_elongation,
+    compute_rod_elongations,
     compute_utilization_ratio,
+    RodSelection,
     select_rod_diameter,
+    select_rod_diameters,
     SeismicParameters,
+    BaseShearResult,
     compute_seismic_base_shear,
     distribute_vertical_forces,
+    distribute_vertical_forces_arr,
+    compute_seismic_forces,
+    compute_seismic_forces_batch,
 )
 
 __all__ = [
@@ -27,11 +36,20 @@ __all__ = [
     "compute_overturning_moment",
     "compute_tension_demand",
     "compute_cumulative_tension",
+    "compute_cumulative_tension_arr",
+    "compute_rod_run_tensions",
     "compute_wood_shrinkage",
     "compute_rod_elongation",
+    "compute_rod_elongations",
     "compute_utilization_ratio",
+    "RodSelection",
     "select_rod_diameter",
+    "select_rod_diameters",
     "SeismicParameters",
+    "BaseShearResult",
     "compute_seismic_base_shear",
     "distribute_vertical_forces",
+    "distribute_vertical_forces_arr",
+    "compute_seismic_forces",
+    "compute_seismic_forces_batch",
 ]
@@ -0,0 +1,36 @@
+"""
+CTR System - Ahead-of-Time Kernel Build
+
+Compiles the fixed-signature numeric kernels from engineering.py into a
+native extension module (ctr_kernels) next to this file, so short scripts
+skip the JIT warm-up on first call. Requires numba at build time only:
+
+    python -m src.core._compiled
+
+engineering.py imports ctr_kernels when it exists and falls back to the
+@njit kernels otherwise.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .engineering import _rod_run_kernel, _seismic_dist_kernel
+
+
+cc = CC('ctr_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    'rod_run_kernel',
+    'UniTuple(f8[:], 2)(b1[:], f8[:], f8[:], f8[:], f8[:], f8)'
+)(_rod_run_kernel.py_func)
+
+cc.export(
+    'seismic_dist',
+    'f8[:](f8, f8[:], f8[:], f8)'
+)(_seismic_dist_kernel.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
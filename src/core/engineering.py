@@ -5,22 +5,33 @@ This module implements the fundamental structural engineering calculations
 for continuous threaded rod design per ASCE 7, NDS, SDPWS, and AISC.
 """
 
+import functools
 import math
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
+import numpy as np
 
-class LoadBasis(Enum):
-    ASD = "ASD"
-    LRFD = "LRFD"
+from ..utils.jit import njit, prange
 
 
-class RodGrade(Enum):
-    ASTM_A307 = "ASTM_A307"
-    ASTM_A36 = "ASTM_A36"
-    ASTM_A193_B7 = "ASTM_A193_B7"
-    ASTM_A449 = "ASTM_A449"
+class LoadBasis(IntEnum):
+    ASD = 0
+    LRFD = 1
+
+
+class RodGrade(IntEnum):
+    ASTM_A307 = 0
+    ASTM_A36 = 1
+    ASTM_A193_B7 = 2
+    ASTM_A449 = 3
+
+    # Short designations
+    A307 = 0
+    A36 = 1
+    A193_B7 = 2
+    A449 = 3
 
 
 class WoodSpecies(Enum):
@@ -38,6 +49,17 @@ MATERIAL_PROPERTIES = {
     RodGrade.ASTM_A449: {"Fy": 92, "Fu": 120}
 }
 
+# Material properties indexed [grade, 0] = Fy, [grade, 1] = Fu (ksi)
+_MATERIAL_ARR = np.array(
+    [[MATERIAL_PROPERTIES[g]["Fy"], MATERIAL_PROPERTIES[g]["Fu"]] for g in RodGrade],
+    dtype=np.float64
+)
+_MATERIAL_ARR.setflags(write=False)
+
+# Factors indexed by LoadBasis
+_DL_FACTOR = (0.6, 0.9)  # Dead load resistance factor
+_CAPACITY_FACTOR = (1 / 2.0, 0.75)  # ASD 1/Ω (Ω = 2.0), LRFD φ
+
 # Thread counts per inch (UNC)
 THREAD_COUNT = {
     0.625: 11,
@@ -50,6 +72,12 @@ THREAD_COUNT = {
     1.500: 6
 }
 
+# Standard diameters and their tensile stress areas, indexed 0..7
+_DIAMETERS = np.array(list(THREAD_COUNT.keys()), dtype=np.float64)
+_N_THREADS = np.array(list(THREAD_COUNT.values()), dtype=np.float64)
+_AS_TABLE = (np.pi / 4) * (_DIAMETERS - 0.9743 / _N_THREADS) ** 2
+_AS_TABLE.setflags(write=False)
+
 # Shrinkage coefficients (tangential)
 SHRINKAGE_COEFFICIENTS = {
     WoodSpecies.DF_L: 0.00267,
@@ -59,6 +87,7 @@ SHRINKAGE_COEFFICIENTS = {
 }
 
 
+@functools.lru_cache(maxsize=16)
 def tensile_stress_area(diameter_in: float) -> float:
     """
     Calculate tensile stress area for threaded rod.
@@ -76,6 +105,20 @@ def tensile_stress_area(diameter_in: float) -> float:
     return As
 
 
+def tensile_stress_area_idx(idx: int) -> float:
+    """
+    Tensile stress area for a standard diameter by table index.
+
+    Args:
+        idx: Index into the standard diameters (0 = 5/8" ... 7 = 1-1/2")
+
+    Returns:
+        Tensile stress area in square inches
+    """
+    return float(_AS_TABLE[idx])
+
+
+@functools.lru_cache(maxsize=128)
 def rod_capacity(
     diameter_in: float,
     grade: RodGrade,
@@ -92,23 +135,21 @@ def rod_capacity(
         grade: ASTM grade designation
         load_basis: ASD or LRFD
 
+    Inputs come from a small finite domain (grades × bases × standard
+    diameters), so results are memoized.
+
     Returns:
         Tuple of (allowable_tension_lb, ultimate_tension_lb)
     """
-    props = MATERIAL_PROPERTIES.get(grade, MATERIAL_PROPERTIES[RodGrade.ASTM_A307])
-    Fu = props["Fu"]  # ksi
+    Fu = float(_MATERIAL_ARR[grade, 1])  # ksi
 
     As = tensile_stress_area(diameter_in)
 
     # Ultimate capacity
     Tu = 0.75 * Fu * As * 1000  # Convert to lbs
 
-    if load_basis == LoadBasis.ASD:
-        Omega = 2.0
-        Ta = Tu / Omega
-    else:  # LRFD
-        phi = 0.75
-        Ta = phi * Tu
+    # ASD: Tu / Ω, LRFD: φ × Tu
+    Ta = _CAPACITY_FACTOR[load_basis] * Tu
 
     return (Ta, Tu)
 
@@ -157,22 +198,34 @@ def compute_tension_demand(
     # Moment arm (holdown to holdown distance)
     moment_arm_ft = wall_length_ft - (2 * holdown_offset_in / 12)
 
-    if moment_arm_ft <= 0:
-        return 0.0
+    return _tension_demand_raw(
+        overturning_moment_ft_lb,
+        moment_arm_ft,
+        tributary_dead_load_lb,
+        _DL_FACTOR[load_basis]
+    )
 
-    # Gross uplift from overturning
-    gross_uplift = overturning_moment_ft_lb / moment_arm_ft
 
-    # Dead load resistance factor
-    dl_factor = 0.6 if load_basis == LoadBasis.ASD else 0.9
+def _tension_demand_raw(
+    moment: float,
+    moment_arm: float,
+    dead_load: float,
+    c_dl: float
+) -> float:
+    """
+    Net tension (M_OT / d) - C_DL × D, zero if compression governs.
+
+    Also zero when the wall is too short to leave a moment arm between
+    holdowns. Takes the resolved dead load factor so loops over many
+    walls look up the load basis once.
+    """
+    if moment_arm <= 0:
+        return 0.0
 
-    # Resisting dead load
-    resisting_dl = dl_factor * tributary_dead_load_lb
+    return max(0.0, moment / moment_arm - c_dl * dead_load)
 
-    # Net tension (zero if compression)
-    net_tension = max(0, gross_uplift - resisting_dl)
 
-    return net_tension
+_tension_demand_jit = njit(inline='always')(_tension_demand_raw)
 
 
 def compute_cumulative_tension(
@@ -189,18 +242,102 @@ def compute_cumulative_tension(
     Returns:
         Dict mapping level to cumulative tension
     """
-    sorted_levels = sorted(level_tensions.keys(), reverse=True)
+    n = len(level_tensions)
+    levels = np.fromiter(level_tensions.keys(), dtype=np.int64, count=n)
+    tensions = np.fromiter(level_tensions.values(), dtype=np.float64, count=n)
+
+    cumulative = compute_cumulative_tension_arr(levels, tensions)
+
+    order = np.argsort(-levels, kind="stable")
+    return dict(zip(levels[order].tolist(), cumulative[order].tolist()))
+
+
+def compute_cumulative_tension_arr(
+    levels: np.ndarray,
+    tensions: np.ndarray
+) -> np.ndarray:
+    """
+    Compute cumulative tension at each level from parallel arrays.
+
+    Array form of compute_cumulative_tension: tensions are summed from
+    the highest level down with a single cumsum.
+
+    Args:
+        levels: Level numbers, shape (L,)
+        tensions: Tension demand at each level, shape (L,)
 
-    cumulative = {}
-    running_total = 0.0
+    Returns:
+        Cumulative tension aligned with the input order, shape (L,)
+    """
+    levels = np.asarray(levels)
+    tensions = np.asarray(tensions, dtype=np.float64)
 
-    for level in sorted_levels:
-        running_total += level_tensions[level]
-        cumulative[level] = running_total
+    order = np.argsort(-levels, kind="stable")
+    cumulative = np.empty_like(tensions)
+    cumulative[order] = np.cumsum(tensions[order])
 
     return cumulative
 
 
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rod_run_kernel(run_start, arms, shears, heights, dead_loads, c_dl):
+    """
+    Net and cumulative tension for walls pre-sorted top to bottom per run.
+
+    T = (M_OT / d) - C_DL × D, with M_OT = V × h.
+    run_start marks the first wall of each run, where the running total resets.
+    """
+    n = arms.shape[0]
+    tensions = np.empty(n)
+    cumulative = np.empty(n)
+    running = 0.0
+
+    for i in range(n):
+        if run_start[i]:
+            running = 0.0
+        t = _tension_demand_jit(shears[i] * heights[i], arms[i], dead_loads[i], c_dl)
+        running += t
+        tensions[i] = t
+        cumulative[i] = running
+
+    return tensions, cumulative
+
+
+def compute_rod_run_tensions(
+    run_start: np.ndarray,
+    moment_arms_ft: np.ndarray,
+    shear_forces_lb: np.ndarray,
+    floor_heights_ft: np.ndarray,
+    dead_loads_lb: np.ndarray,
+    load_basis: LoadBasis
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute net and cumulative tension for stacked walls of many rod runs.
+
+    Array form of compute_tension_demand and compute_cumulative_tension.
+    Walls must be grouped by run and sorted top to bottom within each run.
+
+    Args:
+        run_start: True at the first (top) wall of each run, shape (N,)
+        moment_arms_ft: Holdown-to-holdown distance per wall, shape (N,)
+        shear_forces_lb: Shear force per wall, shape (N,)
+        floor_heights_ft: Floor-to-floor height per wall, shape (N,)
+        dead_loads_lb: Tributary dead load per wall, shape (N,)
+        load_basis: ASD or LRFD
+
+    Returns:
+        Tuple of (net tension, cumulative tension) per wall in pounds
+    """
+    return _rod_run_impl(
+        np.asarray(run_start, dtype=np.bool_),
+        np.asarray(moment_arms_ft, dtype=np.float64),
+        np.asarray(shear_forces_lb, dtype=np.float64),
+        np.asarray(floor_heights_ft, dtype=np.float64),
+        np.asarray(dead_loads_lb, dtype=np.float64),
+        _DL_FACTOR[load_basis]
+    )
+
+
 def compute_wood_shrinkage(
     thickness_in: float,
     species: WoodSpecies,
@@ -257,6 +394,52 @@ def compute_rod_elongation(
     return delta
 
 
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _elongation_kernel(tensions, lengths, diameter_idx, inv_as_e):
+    """Δ_rod = T × L × (1 / (As × E)), with 1 / (As × E) tabulated per diameter."""
+    n = tensions.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        out[i] = tensions[i] * lengths[i] * inv_as_e[diameter_idx[i]]
+    return out
+
+
+def compute_rod_elongations(
+    tensions_lb: np.ndarray,
+    lengths_in: np.ndarray,
+    diameters_in: np.ndarray,
+    E_psi: float = 29_000_000
+) -> np.ndarray:
+    """
+    Compute rod elongation for arrays of rod segments.
+
+    Array form of compute_rod_elongation. The reciprocal 1 / (As × E) is
+    computed once per distinct diameter, so each segment costs two
+    multiplies instead of a division.
+
+    Args:
+        tensions_lb: Tension force per segment in pounds
+        lengths_in: Segment length in inches
+        diameters_in: Rod diameter per segment in inches
+        E_psi: Modulus of elasticity (default steel)
+
+    Returns:
+        Elongation per segment in inches
+    """
+    diameters, diameter_idx = np.unique(
+        np.asarray(diameters_in, dtype=np.float64), return_inverse=True
+    )
+    areas = np.array([tensile_stress_area(float(d)) for d in diameters])
+    inv_as_e = 1.0 / (areas * E_psi)
+
+    return _elongation_kernel(
+        np.asarray(tensions_lb, dtype=np.float64),
+        np.asarray(lengths_in, dtype=np.float64),
+        diameter_idx.astype(np.intp).ravel(),
+        inv_as_e
+    )
+
+
 def compute_utilization_ratio(
     demand_lb: float,
     capacity_lb: float
@@ -276,6 +459,17 @@ def compute_utilization_ratio(
     return demand_lb / capacity_lb
 
 
+class RodSelection(NamedTuple):
+    """Selected rod diameter and design info."""
+    diameter_in: float
+    tensile_area_sq_in: float
+    allowable_tension_lb: float
+    ultimate_tension_lb: float
+    demand_lb: float
+    utilization_ratio: float
+    status: str = 'ACCEPTABLE'
+
+
 def select_rod_diameter(
     demand_lb: float,
     grade: RodGrade,
@@ -283,7 +477,7 @@ def select_rod_diameter(
     max_utilization: float = 0.90,
     min_diameter: float = 0.625,
     max_diameter: float = 1.5
-) -> Optional[Dict]:
+) -> Optional[RodSelection]:
     """
     Select minimum rod diameter to satisfy demand.
 
@@ -296,32 +490,105 @@ def select_rod_diameter(
         max_diameter: Maximum allowable diameter
 
     Returns:
-        Dict with selected diameter and design info, or None if no solution
+        RodSelection with selected diameter and design info, or None if no solution
     """
-    available_diameters = [0.625, 0.75, 0.875, 1.0, 1.125, 1.25, 1.375, 1.5]
+    diameters, allowable, utilization = select_rod_diameters(
+        np.array([demand_lb], dtype=np.float64),
+        grade, load_basis, max_utilization, min_diameter, max_diameter
+    )
+
+    if np.isnan(diameters[0]):
+        return None
 
-    for diameter in available_diameters:
-        if diameter < min_diameter or diameter > max_diameter:
-            continue
+    diameter = float(diameters[0])
+    idx = int(np.searchsorted(_DIAMETERS, diameter))
 
-        allowable, ultimate = rod_capacity(diameter, grade, load_basis)
-        utilization = demand_lb / allowable
+    return RodSelection(
+        diameter,
+        tensile_stress_area_idx(idx),
+        float(allowable[0]),
+        float(_capacity_table(grade, load_basis)[1][idx]),
+        demand_lb,
+        float(utilization[0])
+    )
 
-        if utilization <= max_utilization:
-            return {
-                'diameter_in': diameter,
-                'tensile_area_sq_in': tensile_stress_area(diameter),
-                'allowable_tension_lb': allowable,
-                'ultimate_tension_lb': ultimate,
-                'demand_lb': demand_lb,
-                'utilization_ratio': utilization,
-                'status': 'ACCEPTABLE'
-            }
 
-    return None
+def select_rod_diameters(
+    demands_lb: np.ndarray,
+    grade: RodGrade,
+    load_basis: LoadBasis,
+    max_utilization: float = 0.90,
+    min_diameter: float = 0.625,
+    max_diameter: float = 1.5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Select minimum rod diameter for an array of tension demands.
 
+    Vectorized form of select_rod_diameter: every demand is checked
+    against every standard size in a single (N × 8) array operation.
 
-@dataclass
+    Args:
+        demands_lb: Tension demands in pounds, shape (N,)
+        grade: Rod material grade
+        load_basis: ASD or LRFD
+        max_utilization: Maximum acceptable utilization ratio
+        min_diameter: Minimum allowable diameter
+        max_diameter: Maximum allowable diameter
+
+    Returns:
+        Tuple of (diameters, allowable_tension_lb, utilization_ratios),
+        each shape (N,), with NaN where no standard size is adequate
+    """
+    demands = np.asarray(demands_lb, dtype=np.float64)
+    allowable, _ = _capacity_table(grade, load_basis)
+
+    utilization = demands[:, None] / allowable[None, :]
+    fits = (
+        (utilization <= max_utilization) &
+        (_DIAMETERS >= min_diameter) &
+        (_DIAMETERS <= max_diameter)
+    )
+
+    # First (smallest) standard size that fits
+    idx = fits.argmax(axis=1)
+    no_fit = ~fits.any(axis=1)
+    rows = np.arange(demands.shape[0])
+
+    diameters = _DIAMETERS[idx]
+    capacities = allowable[idx]
+    utilizations = utilization[rows, idx]
+
+    diameters[no_fit] = np.nan
+    capacities[no_fit] = np.nan
+    utilizations[no_fit] = np.nan
+
+    return (diameters, capacities, utilizations)
+
+
+@functools.lru_cache(maxsize=None)
+def _capacity_table(
+    grade: RodGrade,
+    load_basis: LoadBasis
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Allowable and ultimate capacity of every standard diameter.
+
+    Same formulas as rod_capacity, evaluated once per (grade, basis) pair.
+
+    Returns:
+        Tuple of read-only arrays (allowable_tension_lb, ultimate_tension_lb)
+    """
+    Fu = _MATERIAL_ARR[grade, 1]  # ksi
+
+    Tu = 0.75 * Fu * _AS_TABLE * 1000  # Convert to lbs
+    Ta = _CAPACITY_FACTOR[load_basis] * Tu
+
+    Ta.setflags(write=False)
+    Tu.setflags(write=False)
+    return (Ta, Tu)
+
+
+@dataclass(slots=True, frozen=True)
 class SeismicParameters:
     """Seismic design parameters per ASCE 7."""
     sds: float
@@ -332,11 +599,19 @@ class SeismicParameters:
     omega_0: float = 3.0
 
 
+class BaseShearResult(NamedTuple):
+    """Seismic base shear and related values."""
+    base_shear_kips: float
+    Cs: float
+    T_period: float
+    redundancy_factor: float
+
+
 def compute_seismic_base_shear(
     params: SeismicParameters,
     seismic_weight_kips: float,
     total_height_ft: float
-) -> Dict:
+) -> BaseShearResult:
     """
     Compute seismic base shear per ASCE 7-22 §12.8.
 
@@ -346,7 +621,7 @@ def compute_seismic_base_shear(
         total_height_ft: Total building height (feet)
 
     Returns:
-        Dict with base shear and related values
+        BaseShearResult with base shear and related values
     """
     # Approximate period
     T = 0.02 * (total_height_ft ** 0.75)
@@ -366,12 +641,7 @@ def compute_seismic_base_shear(
     # Base shear
     V = Cs * seismic_weight_kips
 
-    return {
-        'base_shear_kips': V,
-        'Cs': Cs,
-        'T_period': T,
-        'redundancy_factor': params.rho
-    }
+    return BaseShearResult(V, Cs, T, params.rho)
 
 
 def distribute_vertical_forces(
@@ -395,27 +665,189 @@ def distribute_vertical_forces(
     Returns:
         Dict of level -> lateral force (kips)
     """
-    # Determine k factor
-    if T_period <= 0.5:
-        k = 1.0
-    elif T_period >= 2.5:
-        k = 2.0
-    else:
-        k = 1.0 + (T_period - 0.5) / 2
-
-    # Compute sum of w*h^k
-    sum_wh_k = sum(
-        level_weights[level] * (level_heights[level] ** k)
-        for level in level_weights
+    levels = list(level_weights)
+    weights = np.array([level_weights[level] for level in levels], dtype=np.float64)
+    heights = np.array([level_heights[level] for level in levels], dtype=np.float64)
+
+    forces = distribute_vertical_forces_arr(base_shear_kips, weights, heights, T_period)
+
+    return dict(zip(levels, forces.tolist()))
+
+
+def distribute_vertical_forces_arr(
+    base_shear_kips: float,
+    weights: np.ndarray,
+    heights: np.ndarray,
+    T_period: float
+) -> np.ndarray:
+    """
+    Distribute base shear vertically from parallel level arrays.
+
+    Array form of distribute_vertical_forces: wx × hx^k is evaluated
+    once per level and reused for both the sum and the distribution,
+    which is a single V / Σ(wi × hi^k) scale instead of a per-level divide.
+
+    Args:
+        base_shear_kips: Total base shear (kips)
+        weights: Seismic weight at each level (kips), shape (L,)
+        heights: Height of each level above the base (feet), shape (L,)
+        T_period: Building period
+
+    Returns:
+        Lateral force at each level (kips), shape (L,)
+    """
+    return _seismic_dist_impl(
+        float(base_shear_kips),
+        np.asarray(weights, dtype=np.float64),
+        np.asarray(heights, dtype=np.float64),
+        float(T_period)
     )
 
-    # Distribute forces
-    forces = {}
-    for level in level_weights:
-        w = level_weights[level]
-        h = level_heights[level]
-        Cvx = (w * (h ** k)) / sum_wh_k if sum_wh_k > 0 else 0
-        Fx = Cvx * base_shear_kips
-        forces[level] = Fx
 
-    return forces
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _seismic_dist_kernel(base_shear, weights, heights, T_period):
+    """Fx = (wx × hx^k) × V / Σ(wi × hi^k) for one building."""
+    # k factor: 1.0 for T <= 0.5, 2.0 for T >= 2.5, linear between
+    k = max(1.0, min(2.0, 1.0 + (T_period - 0.5) / 2.0))
+
+    n = weights.shape[0]
+    out = np.empty(n)
+    sum_wh_k = 0.0
+    for i in range(n):
+        wh_k = weights[i] * heights[i] ** k
+        out[i] = wh_k
+        sum_wh_k += wh_k
+
+    scale = base_shear / sum_wh_k if sum_wh_k > 0 else 0.0
+    for i in range(n):
+        out[i] *= scale
+
+    return out
+
+
+# Prefer the ahead-of-time build of the scalar kernels when it is present
+# (python -m src.core._compiled); otherwise use the JIT versions above.
+try:
+    from .ctr_kernels import (
+        rod_run_kernel as _rod_run_impl,
+        seismic_dist as _seismic_dist_impl,
+    )
+except ImportError:
+    _rod_run_impl = _rod_run_kernel
+    _seismic_dist_impl = _seismic_dist_kernel
+
+
+def compute_seismic_forces(
+    params: SeismicParameters,
+    weights: np.ndarray,
+    heights: np.ndarray
+) -> Tuple[BaseShearResult, np.ndarray]:
+    """
+    Compute base shear and its vertical distribution in one call.
+
+    Seismic weight is the sum of the level weights and the building
+    height is the highest level height.
+
+    Args:
+        params: Seismic design parameters
+        weights: Seismic weight at each level (kips), shape (L,)
+        heights: Height of each level above the base (feet), shape (L,)
+
+    Returns:
+        Tuple of (base shear result, lateral force at each level in kips)
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+
+    base_shear = compute_seismic_base_shear(
+        params,
+        float(weights.sum()),
+        float(heights.max())
+    )
+    forces = distribute_vertical_forces_arr(
+        base_shear.base_shear_kips,
+        weights,
+        heights,
+        base_shear.T_period
+    )
+
+    return (base_shear, forces)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _seismic_kernel(sds, sd1, R, Ie, weights, heights, base_shears, out):
+    """
+    Base shear and vertical distribution for B buildings in parallel.
+
+    Same formulas as compute_seismic_base_shear and
+    distribute_vertical_forces_arr. Row b of weights/heights holds the
+    levels of building b; unused levels are padded with zero weight.
+    Writes base_shears[b] and out[b, :].
+    """
+    B, L = weights.shape
+    Cs_min = max(0.044 * sds * Ie, 0.01)
+
+    for b in prange(B):
+        W = 0.0
+        H = 0.0
+        for j in range(L):
+            W += weights[b, j]
+            if heights[b, j] > H:
+                H = heights[b, j]
+
+        # Approximate period and seismic response coefficient
+        T = 0.02 * H ** 0.75
+        Cs = sds / (R / Ie)
+        if T > 0:
+            Cs = min(Cs, sd1 / (T * R / Ie))
+        Cs = max(Cs, Cs_min)
+
+        V = Cs * W
+        base_shears[b] = V
+
+        k = max(1.0, min(2.0, 1.0 + (T - 0.5) / 2.0))
+
+        # wx × hx^k into the output row, then scale by V / Σ in place
+        sum_wh_k = 0.0
+        for j in range(L):
+            wh_k = weights[b, j] * heights[b, j] ** k
+            out[b, j] = wh_k
+            sum_wh_k += wh_k
+
+        scale = V / sum_wh_k if sum_wh_k > 0 else 0.0
+        for j in range(L):
+            out[b, j] *= scale
+
+
+def compute_seismic_forces_batch(
+    params: SeismicParameters,
+    weights: np.ndarray,
+    heights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute base shear and vertical distribution for many buildings.
+
+    Batch form of compute_seismic_forces for parametric studies that
+    share one set of seismic parameters.
+
+    Args:
+        params: Seismic design parameters
+        weights: Seismic weight per building and level (kips), shape (B, L);
+            pad buildings with fewer levels with zero weight
+        heights: Height of each level above the base (feet), shape (B, L)
+
+    Returns:
+        Tuple of (base shear per building (B,), lateral forces (B, L)) in kips
+    """
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    heights = np.ascontiguousarray(heights, dtype=np.float64)
+
+    base_shears = np.empty(weights.shape[0])
+    forces = np.empty_like(weights)
+
+    _seismic_kernel(
+        float(params.sds), float(params.sd1), float(params.R), float(params.Ie),
+        weights, heights, base_shears, forces
+    )
+
+    return (base_shears, forces)
@@ -12,93 +12,84 @@ Examples:
     full_project_workflow.py - Complete pipeline demonstration
 """
 
-from .basic_rod_design import (
-    design_rod_run,
-    compute_rod_capacity,
-    compute_tension_demand,
-    compute_overturning_moment,
-    select_rod_diameter,
-    RodDesignResult,
-    ShearWallInput,
-    LoadBasis,
-    RodGrade,
-)
+import importlib
 
-from .shrinkage_analysis import (
-    compute_wood_shrinkage,
-    compute_rod_elongation,
-    analyze_rod_run_shrinkage,
-    ShrinkageAnalysisResult,
-    FloorAssembly,
-    WoodSpecies,
-)
-
-from .clash_detection import (
-    ClashDetectionEngine,
-    SpatialElement,
-    Cylinder,
-    Box,
-    Point3D,
-    BoundingBox,
-    ClashResult,
-    ElementType,
-    ClashSeverity,
-)
-
-from .confidence_scoring import (
-    ConfidenceScoreEngine,
-    ComponentScore,
-    ProjectFactors,
-    RiskClassification,
-    PEReviewIntensity,
-)
-
-from .full_project_workflow import (
-    CTRProject,
-    ProjectConfig,
-    ProjectStatus,
-)
-
-__all__ = [
+# Public names by defining example module. The modules are imported on
+# first attribute access rather than here, so running one of them with
+# `python -m src.examples.<name>` does not import it a second time.
+_EXPORTS = {
     # Rod Design
-    'design_rod_run',
-    'compute_rod_capacity',
-    'compute_tension_demand',
-    'compute_overturning_moment',
-    'select_rod_diameter',
-    'RodDesignResult',
-    'ShearWallInput',
-    'LoadBasis',
-    'RodGrade',
+    'basic_rod_design': (
+        'design_rod_run',
+        'design_rod_runs_batch',
+        'compute_rod_capacity',
+        'compute_tension_demand',
+        'compute_overturning_moment',
+        'select_rod_diameter',
+        'select_rod_diameters',
+        'RodDesignResult',
+        'ShearWallInput',
+        'LoadBasis',
+        'RodGrade',
+    ),
 
     # Shrinkage
-    'compute_wood_shrinkage',
-    'compute_rod_elongation',
-    'analyze_rod_run_shrinkage',
-    'ShrinkageAnalysisResult',
-    'FloorAssembly',
-    'WoodSpecies',
+    'shrinkage_analysis': (
+        'compute_wood_shrinkage',
+        'compute_rod_elongation',
+        'analyze_rod_run_shrinkage',
+        'sweep_joist_depth_shrinkage',
+        'ShrinkageAnalysisResult',
+        'FloorDetails',
+        'FloorAssembly',
+        'WoodSpecies',
+    ),
 
     # Clash Detection
-    'ClashDetectionEngine',
-    'SpatialElement',
-    'Cylinder',
-    'Box',
-    'Point3D',
-    'BoundingBox',
-    'ClashResult',
-    'ElementType',
-    'ClashSeverity',
+    'clash_detection': (
+        'ClashDetectionEngine',
+        'SpatialElement',
+        'Cylinder',
+        'Box',
+        'Point3D',
+        'BoundingBox',
+        'ClashResult',
+        'ElementType',
+        'ClashSeverity',
+    ),
 
     # Confidence Scoring
-    'ConfidenceScoreEngine',
-    'ComponentScore',
-    'ProjectFactors',
-    'RiskClassification',
-    'PEReviewIntensity',
+    'confidence_scoring': (
+        'ConfidenceScoreEngine',
+        'ComponentScore',
+        'ProjectFactors',
+        'RiskClassification',
+        'PEReviewIntensity',
+    ),
 
     # Project Workflow
-    'CTRProject',
-    'ProjectConfig',
-    'ProjectStatus',
-]
+    'full_project_workflow': (
+        'CTRProject',
+        'ProjectConfig',
+        'ProjectStatus',
+    ),
+}
+
+_MODULE_OF = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,31 @@
+"""
+CTR System - Ahead-of-Time Shrinkage Kernel Build
+
+Compiles the scalar kernels from shrinkage_analysis.py into a native
+extension module (ctr_shrinkage) next to this file, so short scripts skip
+the JIT warm-up and dispatcher on every call. Requires numba at build
+time only:
+
+    python -m src.examples._compiled
+
+shrinkage_analysis.py imports ctr_shrinkage when it exists and falls back
+to the @njit kernels otherwise.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .shrinkage_analysis import _elongation_kernel, _shrinkage_kernel
+
+
+cc = CC('ctr_shrinkage')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('shrinkage', 'f8(f8, f8, f8, f8, f8)')(_shrinkage_kernel.py_func)
+
+cc.export('rod_elongation', 'f8(f8, f8, f8, f8)')(_elongation_kernel.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
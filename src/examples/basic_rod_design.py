@@ -5,48 +5,46 @@ Demonstrates core rod sizing calculations for a single rod run
 through a 5-story building.
 """
 
-import sys
-sys.path.insert(0, '../..')
-
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
-from enum import Enum
-import math
-
-
-class LoadBasis(Enum):
-    ASD = "ASD"
-    LRFD = "LRFD"
-
-
-class RodGrade(Enum):
-    A307 = "A307"
-    A36 = "A36"
-    A449 = "A449"
-    A193_B7 = "A193-B7"
-
-
-@dataclass
-class RodProperties:
-    """Properties for threaded rod materials."""
-    grade: RodGrade
-    fy_ksi: float  # Yield strength
-    fu_ksi: float  # Ultimate strength
-
+import os
+import sys
 
-ROD_GRADES = {
-    RodGrade.A307: RodProperties(RodGrade.A307, 36, 60),
-    RodGrade.A36: RodProperties(RodGrade.A36, 36, 58),
-    RodGrade.A449: RodProperties(RodGrade.A449, 92, 120),
-    RodGrade.A193_B7: RodProperties(RodGrade.A193_B7, 105, 125),
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as a script (python src/examples/<name>.py): resolve the
+    # relative imports below from the repository root (PEP 366)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))))
+    __package__ = "src.examples"
+
+from ..core.engineering import (
+    LoadBasis,
+    RodGrade,
+    tensile_stress_area,
+    compute_overturning_moment,
+    compute_tension_demand as _compute_tension_demand,
+    compute_rod_run_tensions,
+    rod_capacity,
+    select_rod_diameter as _select_rod_diameter,
+    select_rod_diameters as _select_rod_diameters,
+)
+
+
+# Holdown offset from each wall end (inches)
+HOLDOWN_OFFSET_IN = 6.0
+
+# Printed designation for each rod grade
+_GRADE_LABELS = {
+    RodGrade.A307: "A307",
+    RodGrade.A36: "A36",
+    RodGrade.A449: "A449",
+    RodGrade.A193_B7: "A193-B7",
 }
 
 
-# Standard rod diameters (inches)
-STANDARD_DIAMETERS = [0.625, 0.750, 0.875, 1.000, 1.125, 1.250, 1.375, 1.500]
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShearWallInput:
     """Input data for a shear wall at a single level."""
     level: int
@@ -56,51 +54,47 @@ class ShearWallInput:
     dead_load_plf: float  # Dead load on wall (lb/ft)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class RodDesignResult:
-    """Results from rod design calculation."""
+    """
+    Results from rod design calculation.
+
+    levels, level_tensions and cumulative_tensions are aligned arrays
+    ordered top to bottom.
+    """
     rod_diameter_in: float
     rod_grade: RodGrade
-    level_tensions: Dict[int, float]
-    cumulative_tensions: Dict[int, float]
+    levels: np.ndarray
+    level_tensions: np.ndarray
+    cumulative_tensions: np.ndarray
     max_tension_lb: float
     allowable_tension_lb: float
     utilization_ratio: float
     total_length_ft: float
+    _level_tensions_dict: Optional[Dict[int, float]] = field(
+        default=None, init=False, repr=False
+    )
+    _cumulative_tensions_dict: Optional[Dict[int, float]] = field(
+        default=None, init=False, repr=False
+    )
 
-
-def tensile_stress_area(diameter_in: float) -> float:
-    """
-    Calculate tensile stress area for threaded rod per AISC.
-
-    A_s = (π/4) × (d - 0.9743/n)²
-
-    For UNC threads, n ≈ 8/d for standard sizes.
-    """
-    # Approximate threads per inch for UNC
-    threads_per_inch = {
-        0.625: 11,
-        0.750: 10,
-        0.875: 9,
-        1.000: 8,
-        1.125: 7,
-        1.250: 7,
-        1.375: 6,
-        1.500: 6,
-    }
-
-    n = threads_per_inch.get(diameter_in, 8 / diameter_in)
-    d_eff = diameter_in - 0.9743 / n
-    return (math.pi / 4) * d_eff ** 2
-
-
-def compute_overturning_moment(shear_force_lb: float, story_height_ft: float) -> float:
-    """
-    Calculate overturning moment at base of wall segment.
-
-    M_OT = V × h
-    """
-    return shear_force_lb * story_height_ft
+    @property
+    def level_tensions_dict(self) -> Dict[int, float]:
+        """Level -> net tension (lb), built on first access."""
+        if self._level_tensions_dict is None:
+            self._level_tensions_dict = dict(
+                zip(self.levels.tolist(), self.level_tensions.tolist())
+            )
+        return self._level_tensions_dict
+
+    @property
+    def cumulative_tensions_dict(self) -> Dict[int, float]:
+        """Level -> cumulative tension (lb), built on first access."""
+        if self._cumulative_tensions_dict is None:
+            self._cumulative_tensions_dict = dict(
+                zip(self.levels.tolist(), self.cumulative_tensions.tolist())
+            )
+        return self._cumulative_tensions_dict
 
 
 def compute_tension_demand(
@@ -114,21 +108,18 @@ def compute_tension_demand(
 
     T = (M_OT / d) - C_DL × W_DL
 
-    Where C_DL is the dead load coefficient:
+    Where d is the wall length less a 6" holdown offset at each end
+    and C_DL is the dead load coefficient:
     - ASD: 0.6
     - LRFD: 0.9
     """
-    # Moment arm (distance between holdowns)
-    # Typically wall length minus 2 × offset (6" each end)
-    moment_arm_ft = wall_length_ft - 1.0  # 6" offset each end
-
-    # Dead load coefficient
-    c_dl = 0.6 if load_basis == LoadBasis.ASD else 0.9
-
-    # Tension demand
-    tension = (overturning_moment_ft_lb / moment_arm_ft) - (c_dl * dead_load_lb)
-
-    return max(0, tension)  # Cannot be negative
+    return _compute_tension_demand(
+        overturning_moment_ft_lb,
+        wall_length_ft,
+        HOLDOWN_OFFSET_IN,
+        dead_load_lb,
+        load_basis
+    )
 
 
 def compute_rod_capacity(
@@ -144,16 +135,7 @@ def compute_rod_capacity(
 
     Where Ω = 2.0 (ASD), φ = 0.75 (LRFD)
     """
-    props = ROD_GRADES[grade]
-    a_s = tensile_stress_area(diameter_in)
-
-    # Nominal strength
-    nominal = 0.75 * props.fu_ksi * 1000 * a_s  # Convert ksi to psi
-
-    if load_basis == LoadBasis.ASD:
-        return nominal / 2.0  # Ω = 2.0
-    else:
-        return 0.75 * nominal  # φ = 0.75
+    return rod_capacity(diameter_in, grade, load_basis)[0]
 
 
 def select_rod_diameter(
@@ -167,78 +149,162 @@ def select_rod_diameter(
 
     Returns: (diameter, capacity, utilization) or None if no size works
     """
-    for diameter in STANDARD_DIAMETERS:
-        capacity = compute_rod_capacity(diameter, grade, load_basis)
-        utilization = required_capacity_lb / capacity
+    selection = _select_rod_diameter(
+        required_capacity_lb, grade, load_basis, max_utilization
+    )
+
+    if selection is None:
+        return None
+
+    return (
+        selection.diameter_in,
+        selection.allowable_tension_lb,
+        selection.utilization_ratio
+    )
+
+
+def select_rod_diameters(
+    required_capacities_lb: np.ndarray,
+    grade: RodGrade = RodGrade.A307,
+    load_basis: LoadBasis = LoadBasis.ASD,
+    max_utilization: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Select minimum rod diameter for an array of required capacities.
 
-        if utilization <= max_utilization:
-            return (diameter, capacity, utilization)
+    Returns: (diameters, capacities, utilizations) arrays, NaN where no size works
+    """
+    return _select_rod_diameters(
+        required_capacities_lb, grade, load_basis, max_utilization
+    )
 
-    return None
 
+def _is_run_sorted(run_ids: np.ndarray, levels: np.ndarray) -> bool:
+    """True if walls are ordered by run id, then by descending level."""
+    same_run = run_ids[1:] == run_ids[:-1]
+    return bool(
+        np.all(run_ids[1:] >= run_ids[:-1])
+        and np.all(levels[1:][same_run] <= levels[:-1][same_run])
+    )
 
-def design_rod_run(
-    walls: List[ShearWallInput],
+
+def design_rod_runs_batch(
+    walls_soa: Dict[str, np.ndarray],
+    run_ids: np.ndarray,
     load_basis: LoadBasis = LoadBasis.ASD,
-    rod_grade: RodGrade = RodGrade.A307
-) -> RodDesignResult:
+    rod_grade: RodGrade = RodGrade.A307,
+    assume_sorted: bool = False
+) -> Dict[object, RodDesignResult]:
     """
-    Design a continuous rod run for a stack of shear walls.
+    Design many rod runs at once from struct-of-arrays wall data.
 
-    This calculates tension at each level and selects appropriate rod size.
+    walls_soa holds aligned arrays keyed by ShearWallInput field name
+    (level, length_ft, unit_shear_plf, story_height_ft, dead_load_plf).
+    run_ids assigns each wall to a rod run. Tension and cumulative
+    tension are computed by compute_rod_run_tensions in a single
+    compiled pass over every wall in every run.
+
+    Walls already grouped by run and ordered top to bottom are detected
+    in O(N) and used as-is; pass assume_sorted=True to skip the check.
+
+    Returns: Dict of run_id -> RodDesignResult
     """
-    # Sort walls by level (top to bottom for accumulation)
-    walls_sorted = sorted(walls, key=lambda w: w.level, reverse=True)
-
-    level_tensions = {}
-    cumulative_tensions = {}
-    cumulative = 0.0
-    total_length = 0.0
-
-    for wall in walls_sorted:
-        # Calculate shear force at this level
-        shear_force = wall.unit_shear_plf * wall.length_ft
-
-        # Calculate overturning moment
-        moment = compute_overturning_moment(shear_force, wall.story_height_ft)
-
-        # Calculate dead load resisting
-        dead_load = wall.dead_load_plf * wall.length_ft
-
-        # Calculate tension demand at this level
-        tension = compute_tension_demand(
-            moment,
-            wall.length_ft,
-            dead_load,
-            load_basis
+    run_ids = np.asarray(run_ids)
+    levels = np.asarray(walls_soa['level'])
+
+    length = np.asarray(walls_soa['length_ft'], dtype=np.float64)
+    unit_shear = np.asarray(walls_soa['unit_shear_plf'], dtype=np.float64)
+    height = np.asarray(walls_soa['story_height_ft'], dtype=np.float64)
+    dead_load_plf = np.asarray(walls_soa['dead_load_plf'], dtype=np.float64)
+
+    # Group by run, then top to bottom within each run
+    if not (assume_sorted or _is_run_sorted(run_ids, levels)):
+        order = np.lexsort((-levels, run_ids))
+        run_ids = run_ids[order]
+        levels = levels[order]
+        length = length[order]
+        unit_shear = unit_shear[order]
+        height = height[order]
+        dead_load_plf = dead_load_plf[order]
+
+    if run_ids.size == 0:
+        return {}
+
+    # Run boundaries in the sorted arrays
+    run_start = np.r_[True, run_ids[1:] != run_ids[:-1]]
+    starts = np.flatnonzero(run_start)
+    counts = np.diff(np.r_[starts, run_ids.size])
+
+    tension, cumulative = compute_rod_run_tensions(
+        run_start,
+        length - 2 * HOLDOWN_OFFSET_IN / 12,
+        length * unit_shear,
+        height,
+        dead_load_plf * length,
+        load_basis
+    )
+
+    # Tensions are clamped at zero, so each run's cumulative tension is
+    # non-decreasing and its maximum is the value at the bottom wall
+    max_tensions = cumulative[starts + counts - 1]
+    total_lengths = np.add.reduceat(height, starts)
+
+    diameters, capacities, utilizations = select_rod_diameters(
+        max_tensions, rod_grade, load_basis
+    )
+
+    no_fit = np.isnan(diameters)
+    if no_fit.any():
+        max_tension = max_tensions[no_fit.argmax()]
+        raise ValueError(f"No standard rod size adequate for {max_tension:.0f} lb demand")
+
+    results = {}
+    for k, start in enumerate(starts):
+        stop = start + counts[k]
+
+        results[run_ids[start].item()] = RodDesignResult(
+            rod_diameter_in=float(diameters[k]),
+            rod_grade=rod_grade,
+            levels=levels[start:stop],
+            level_tensions=tension[start:stop],
+            cumulative_tensions=cumulative[start:stop],
+            max_tension_lb=float(max_tensions[k]),
+            allowable_tension_lb=float(capacities[k]),
+            utilization_ratio=float(utilizations[k]),
+            total_length_ft=float(total_lengths[k])
         )
 
-        level_tensions[wall.level] = tension
-        cumulative += tension
-        cumulative_tensions[wall.level] = cumulative
-        total_length += wall.story_height_ft
+    return results
 
-    # Find maximum cumulative tension
-    max_tension = max(cumulative_tensions.values())
 
-    # Select rod size
-    selection = select_rod_diameter(max_tension, rod_grade, load_basis)
+def design_rod_run(
+    walls: List[ShearWallInput],
+    load_basis: LoadBasis = LoadBasis.ASD,
+    rod_grade: RodGrade = RodGrade.A307,
+    assume_sorted: bool = False
+) -> RodDesignResult:
+    """
+    Design a continuous rod run for a stack of shear walls.
 
-    if selection is None:
-        raise ValueError(f"No standard rod size adequate for {max_tension:.0f} lb demand")
+    This calculates tension at each level and selects appropriate rod size.
+    Single-run wrapper around design_rod_runs_batch. Pass
+    assume_sorted=True when walls are already listed top to bottom.
+    """
+    if not walls:
+        raise ValueError("Rod run requires at least one shear wall")
+
+    walls_soa = {
+        'level': np.array([w.level for w in walls]),
+        'length_ft': np.array([w.length_ft for w in walls], dtype=np.float64),
+        'unit_shear_plf': np.array([w.unit_shear_plf for w in walls], dtype=np.float64),
+        'story_height_ft': np.array([w.story_height_ft for w in walls], dtype=np.float64),
+        'dead_load_plf': np.array([w.dead_load_plf for w in walls], dtype=np.float64),
+    }
+    run_ids = np.zeros(len(walls), dtype=np.int64)
 
-    diameter, capacity, utilization = selection
-
-    return RodDesignResult(
-        rod_diameter_in=diameter,
-        rod_grade=rod_grade,
-        level_tensions=level_tensions,
-        cumulative_tensions=cumulative_tensions,
-        max_tension_lb=max_tension,
-        allowable_tension_lb=capacity,
-        utilization_ratio=utilization,
-        total_length_ft=total_length
-    )
+    return design_rod_runs_batch(
+        walls_soa, run_ids, load_basis, rod_grade, assume_sorted
+    )[0]
 
 
 def print_design_results(result: RodDesignResult, rod_run_id: str = "RR-A-01"):
@@ -247,7 +313,7 @@ def print_design_results(result: RodDesignResult, rod_run_id: str = "RR-A-01"):
     print(f"ROD RUN DESIGN RESULTS: {rod_run_id}")
     print("=" * 70)
 
-    print(f"\nSelected Rod: {result.rod_diameter_in}\" diameter, {result.rod_grade.value}")
+    print(f"\nSelected Rod: {result.rod_diameter_in}\" diameter, {_GRADE_LABELS[result.rod_grade]}")
     print(f"Total Length: {result.total_length_ft:.1f} ft")
     print(f"Maximum Tension: {result.max_tension_lb:,.0f} lb")
     print(f"Allowable Tension: {result.allowable_tension_lb:,.0f} lb")
@@ -257,9 +323,10 @@ def print_design_results(result: RodDesignResult, rod_run_id: str = "RR-A-01"):
     print(f"{'Level':<8}{'Level Tension (lb)':<22}{'Cumulative (lb)':<20}{'Status'}")
     print("-" * 70)
 
-    for level in sorted(result.level_tensions.keys(), reverse=True):
-        tension = result.level_tensions[level]
-        cumulative = result.cumulative_tensions[level]
+    for i in np.argsort(-result.levels, kind='stable').tolist():
+        level = result.levels[i]
+        tension = result.level_tensions[i]
+        cumulative = result.cumulative_tensions[i]
         utilization = cumulative / result.allowable_tension_lb
         status = "OK" if utilization <= 1.0 else "OVER"
 
@@ -324,17 +391,17 @@ if __name__ == "__main__":
 
     # Design with ASD
     print("\n\n>>> Designing with ASD load basis...")
-    result_asd = design_rod_run(wall_stack, LoadBasis.ASD, RodGrade.A307)
+    result_asd = design_rod_run(wall_stack, LoadBasis.ASD, RodGrade.A307, assume_sorted=True)
     print_design_results(result_asd, "RR-A-01")
 
     # Design with LRFD
     print("\n>>> Designing with LRFD load basis...")
-    result_lrfd = design_rod_run(wall_stack, LoadBasis.LRFD, RodGrade.A307)
+    result_lrfd = design_rod_run(wall_stack, LoadBasis.LRFD, RodGrade.A307, assume_sorted=True)
     print_design_results(result_lrfd, "RR-A-01-LRFD")
 
     # Try with higher grade material
     print("\n>>> Designing with A449 high-strength rod...")
-    result_high = design_rod_run(wall_stack, LoadBasis.ASD, RodGrade.A449)
+    result_high = design_rod_run(wall_stack, LoadBasis.ASD, RodGrade.A449, assume_sorted=True)
     print_design_results(result_high, "RR-A-01-HS")
 
     # Summary comparison
@@ -343,7 +410,7 @@ if __name__ == "__main__":
     print("=" * 70)
     print(f"{'Method':<20}{'Diameter':<12}{'Grade':<12}{'Utilization'}")
     print("-" * 70)
-    print(f"{'ASD':<20}{result_asd.rod_diameter_in}\"{'':8}{result_asd.rod_grade.value:<12}{result_asd.utilization_ratio:.2f}")
-    print(f"{'LRFD':<20}{result_lrfd.rod_diameter_in}\"{'':8}{result_lrfd.rod_grade.value:<12}{result_lrfd.utilization_ratio:.2f}")
-    print(f"{'ASD + A449':<20}{result_high.rod_diameter_in}\"{'':8}{result_high.rod_grade.value:<12}{result_high.utilization_ratio:.2f}")
+    print(f"{'ASD':<20}{result_asd.rod_diameter_in}\"{'':8}{_GRADE_LABELS[result_asd.rod_grade]:<12}{result_asd.utilization_ratio:.2f}")
+    print(f"{'LRFD':<20}{result_lrfd.rod_diameter_in}\"{'':8}{_GRADE_LABELS[result_lrfd.rod_grade]:<12}{result_lrfd.utilization_ratio:.2f}")
+    print(f"{'ASD + A449':<20}{result_high.rod_diameter_in}\"{'':8}{_GRADE_LABELS[result_high.rod_grade]:<12}{result_high.utilization_ratio:.2f}")
     print()
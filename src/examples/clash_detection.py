@@ -5,27 +5,48 @@ Demonstrates 3D spatial indexing and geometric intersection
 detection between rod runs and MEP elements.
 """
 
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Generator
-from enum import Enum
+from enum import IntEnum
+import functools
 import math
+import os
+import sys
 
+import numpy as np
 
-class ElementType(Enum):
-    ROD = "ROD"
-    HVAC_DUCT = "HVAC_DUCT"
-    PLUMBING_PIPE = "PLUMBING_PIPE"
-    ELECTRICAL_CONDUIT = "ELECTRICAL_CONDUIT"
-    FIRE_SPRINKLER = "FIRE_SPRINKLER"
-    STRUCTURAL_BEAM = "STRUCTURAL_BEAM"
-    CABLE_TRAY = "CABLE_TRAY"
+if __package__ in (None, ""):
+    # Run as a script (python src/examples/<name>.py): resolve the
+    # relative imports below from the repository root (PEP 366)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))))
+    __package__ = "src.examples"
 
+from ..utils.jit import njit, prange, NUMBA_AVAILABLE
 
-class ClashSeverity(Enum):
-    CRITICAL = "CRITICAL"  # Hard interference
-    MAJOR = "MAJOR"        # Clearance violation > 50%
-    MINOR = "MINOR"        # Clearance violation < 50%
-    WARNING = "WARNING"    # Near limit
+try:
+    from rtree import index as rtree_index
+except ImportError:  # optional backend
+    rtree_index = None
+
+
+class ElementType(IntEnum):
+    ROD = 0
+    HVAC_DUCT = 1
+    PLUMBING_PIPE = 2
+    ELECTRICAL_CONDUIT = 3
+    FIRE_SPRINKLER = 4
+    STRUCTURAL_BEAM = 5
+    CABLE_TRAY = 6
+
+
+class ClashSeverity(IntEnum):
+    CRITICAL = 0  # Hard interference
+    MAJOR = 1     # Clearance violation > 50%
+    MINOR = 2     # Clearance violation < 50%
+    WARNING = 3   # Near limit
 
 
 # Minimum clearances by element type (inches)
@@ -38,8 +59,44 @@ CLEARANCE_REQUIREMENTS = {
     ElementType.CABLE_TRAY: 1.5,
 }
 
+# Minimum clearance indexed by ElementType (1.0" where unspecified)
+_CLEARANCE_ARR = np.array(
+    [CLEARANCE_REQUIREMENTS.get(t, 1.0) for t in ElementType], dtype=np.float64
+)
+_CLEARANCE_ARR.setflags(write=False)
+
+# Trade responsible for relocating each element type
+_TRADE_MAP = {
+    ElementType.HVAC_DUCT: "MECHANICAL",
+    ElementType.PLUMBING_PIPE: "PLUMBING",
+    ElementType.ELECTRICAL_CONDUIT: "ELECTRICAL",
+    ElementType.FIRE_SPRINKLER: "FIRE_PROTECTION",
+    ElementType.STRUCTURAL_BEAM: "STRUCTURAL",
+    ElementType.CABLE_TRAY: "ELECTRICAL",
+}
+
+# Z-slab height for SpatialIndex slab bucketing (one story, inches)
+SLAB_HEIGHT_IN = 144.0
+
+# Clearances below this multiple of the requirement are reported as warnings
+WARNING_CLEARANCE_FACTOR = 1.5
+
+# Minimum candidate count before cylinder pairs are batched
+BATCH_MIN_CANDIDATES = 4
+
+# Geometry kinds (SpatialElement.geom_kind and the narrowphase arrays)
+_KIND_OTHER = -1
+_KIND_CYLINDER = 0
+_KIND_BOX = 1
+
+# Severity code for "no clash" in classify_severity_batch output
+NO_CLASH = -1
 
-@dataclass
+# ClashSeverity members indexed by code (cheaper than the enum lookup)
+_SEVERITY_BY_CODE = tuple(ClashSeverity)
+
+
+@dataclass(slots=True, frozen=True)
 class Point3D:
     """3D point representation."""
     x: float
@@ -61,6 +118,9 @@ class Point3D:
     def length(self) -> float:
         return math.sqrt(self.x**2 + self.y**2 + self.z**2)
 
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
     def normalized(self) -> 'Point3D':
         length = self.length()
         if length == 0:
@@ -68,7 +128,7 @@ class Point3D:
         return Point3D(self.x / length, self.y / length, self.z / length)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     """Axis-aligned bounding box."""
     min_point: Point3D
@@ -108,15 +168,28 @@ class BoundingBox:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cylinder:
     """Cylinder representation for rods and pipes."""
     start: Point3D
     end: Point3D
     radius: float
+    _bounds: Optional[BoundingBox] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def bounds(self) -> BoundingBox:
+        """Axis-aligned bounding box, computed once."""
+        if self._bounds is None:
+            object.__setattr__(self, '_bounds', self._compute_bounds())
+        return self._bounds
 
     def get_bounds(self) -> BoundingBox:
         """Calculate axis-aligned bounding box."""
+        return self.bounds
+
+    def _compute_bounds(self) -> BoundingBox:
         return BoundingBox(
             Point3D(
                 min(self.start.x, self.end.x) - self.radius,
@@ -131,16 +204,29 @@ class Cylinder:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Box:
     """Box representation for ducts and beams."""
     center: Point3D
     width: float   # X dimension
     height: float  # Y dimension
     depth: float   # Z dimension
+    _bounds: Optional[BoundingBox] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def bounds(self) -> BoundingBox:
+        """Axis-aligned bounding box, computed once."""
+        if self._bounds is None:
+            object.__setattr__(self, '_bounds', self._compute_bounds())
+        return self._bounds
 
     def get_bounds(self) -> BoundingBox:
         """Calculate axis-aligned bounding box."""
+        return self.bounds
+
+    def _compute_bounds(self) -> BoundingBox:
         half_w = self.width / 2
         half_h = self.height / 2
         half_d = self.depth / 2
@@ -158,20 +244,52 @@ class Box:
         )
 
 
-@dataclass
+def _geometry_kind(geometry: object) -> int:
+    """Geometry kind tag for a Cylinder, Box or other geometry."""
+    if isinstance(geometry, Cylinder):
+        return _KIND_CYLINDER
+    if isinstance(geometry, Box):
+        return _KIND_BOX
+    return _KIND_OTHER
+
+
+@dataclass(slots=True)
 class SpatialElement:
-    """Element with spatial representation."""
+    """
+    Element with spatial representation.
+
+    geom_kind tags the geometry type for integer dispatch. Bounds are
+    computed once on first use; replacing geometry resets both. Cylinder
+    and Box are frozen, so their bounds cannot go stale.
+    """
     element_id: str
     element_type: ElementType
     geometry: object  # Cylinder or Box
     level: int
     description: str = ""
+    geom_kind: int = field(
+        default=_KIND_OTHER, init=False, repr=False, compare=False
+    )
+    _bounds: Optional[BoundingBox] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(self, 'geom_kind', _geometry_kind(self.geometry))
+
+    def __setattr__(self, name, value):
+        if name == 'geometry':
+            object.__setattr__(self, '_bounds', None)
+            object.__setattr__(self, 'geom_kind', _geometry_kind(value))
+        object.__setattr__(self, name, value)
 
     def get_bounds(self) -> BoundingBox:
-        return self.geometry.get_bounds()
+        if self._bounds is None:
+            self._bounds = self.geometry.get_bounds()
+        return self._bounds
 
 
-@dataclass
+@dataclass(slots=True)
 class ClashResult:
     """Result of clash detection between two elements."""
     element_1_id: str
@@ -184,177 +302,899 @@ class ClashResult:
     clearance_actual_in: float
     intersection_point: Point3D
     level: int
-    description: str
-    recommendations: List[str] = field(default_factory=list)
+    _description: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _recommendation_list: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def description(self) -> str:
+        """Human-readable clash summary, formatted on first access."""
+        if self._description is None:
+            self._description = _clash_description(
+                self.severity,
+                self.penetration_in,
+                self.clearance_actual_in,
+                self.clearance_required_in,
+            )
+        return self._description
+
+    @property
+    def recommendations(self) -> List[str]:
+        """Resolution recommendations, built on first access."""
+        if self._recommendation_list is None:
+            self._recommendation_list = list(
+                _recommendations(self.severity, self.element_2_type)
+            )
+        return self._recommendation_list
 
 
-def distance_point_to_line_segment(
-    point: Point3D,
-    line_start: Point3D,
-    line_end: Point3D
-) -> Tuple[float, float]:
-    """
-    Calculate distance from point to line segment.
+# Fast-math flags for the geometric kernels; nnan/ninf are left out so the
+# non-finite checks in the cylinder-box kernel stay meaningful
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
 
-    Returns: (distance, parameter t along line)
-    """
-    v = line_end - line_start
-    w = point - line_start
 
-    c1 = w.dot(v)
-    c2 = v.dot(v)
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _point_segment_kernel(px, py, pz, sx, sy, sz, ex, ey, ez):
+    """Distance from point p to segment s-e and the clamped parameter t."""
+    vx, vy, vz = ex - sx, ey - sy, ez - sz
+    wx, wy, wz = px - sx, py - sy, pz - sz
+
+    c1 = wx * vx + wy * vy + wz * vz
+    c2 = vx * vx + vy * vy + vz * vz
 
     if c2 == 0:
         # Degenerate segment (point)
-        return (point - line_start).length(), 0.0
+        return math.sqrt(wx * wx + wy * wy + wz * wz), 0.0
 
     t = c1 / c2
 
     if t <= 0:
-        return (point - line_start).length(), 0.0
+        return math.sqrt(wx * wx + wy * wy + wz * wz), 0.0
     elif t >= 1:
-        return (point - line_end).length(), 1.0
+        gx, gy, gz = px - ex, py - ey, pz - ez
+        return math.sqrt(gx * gx + gy * gy + gz * gz), 1.0
     else:
-        closest = line_start + v * t
-        return (point - closest).length(), t
+        cx = px - (sx + vx * t)
+        cy = py - (sy + vy * t)
+        cz = pz - (sz + vz * t)
+        return math.sqrt(cx * cx + cy * cy + cz * cz), t
 
 
-def cylinder_cylinder_intersection(
-    cyl1: Cylinder,
-    cyl2: Cylinder
-) -> Tuple[bool, Optional[float], Optional[Point3D]]:
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _cyl_cyl_kernel(ax, ay, az, bx, by, bz, r1, cx, cy, cz, dx, dy, dz, r2):
     """
-    Detect intersection between two finite cylinders.
+    Cylinder a-b (radius r1) against cylinder c-d (radius r2).
 
-    Returns: (intersects, penetration_depth, intersection_point)
+    Returns (hit, penetration, ix, iy, iz); only meaningful when hit.
     """
     # Direction vectors
-    d1 = cyl1.end - cyl1.start
-    d2 = cyl2.end - cyl2.start
+    d1x, d1y, d1z = bx - ax, by - ay, bz - az
+    d2x, d2y, d2z = dx - cx, dy - cy, dz - cz
 
-    len1 = d1.length()
-    len2 = d2.length()
+    len1 = math.sqrt(d1x * d1x + d1y * d1y + d1z * d1z)
+    len2 = math.sqrt(d2x * d2x + d2y * d2y + d2z * d2z)
 
     if len1 == 0 or len2 == 0:
-        return (False, None, None)
+        return False, 0.0, 0.0, 0.0, 0.0
 
-    # Unit direction vectors
-    u1 = d1.normalized()
-    u2 = d2.normalized()
+    # Unit direction vectors, reused for the closest points below
+    u1x, u1y, u1z = d1x / len1, d1y / len1, d1z / len1
+    u2x, u2y, u2z = d2x / len2, d2y / len2, d2z / len2
 
     # Find closest points between axis lines
-    w = cyl1.start - cyl2.start
-    a = u1.dot(u1)  # = 1
-    b = u1.dot(u2)
-    c = u2.dot(u2)  # = 1
-    d = u1.dot(w)
-    e = u2.dot(w)
+    wx, wy, wz = ax - cx, ay - cy, az - cz
+    a = u1x * u1x + u1y * u1y + u1z * u1z  # = 1
+    b = u1x * u2x + u1y * u2y + u1z * u2z
+    c = u2x * u2x + u2y * u2y + u2z * u2z  # = 1
+    d = u1x * wx + u1y * wy + u1z * wz
+    e = u2x * wx + u2y * wy + u2z * wz
 
     denom = a * c - b * b
 
     if abs(denom) < 1e-10:
         # Lines are parallel
-        t1, t2 = 0, -e / c if c != 0 else 0
+        t1 = 0.0
+        t2 = -e / c if c != 0 else 0.0
     else:
         t1 = (b * e - c * d) / denom
         t2 = (a * e - b * d) / denom
 
     # Clamp to segment bounds
-    t1 = max(0, min(1, t1 / len1)) * len1 if len1 > 0 else 0
-    t2 = max(0, min(1, t2 / len2)) * len2 if len2 > 0 else 0
+    t1 = max(0.0, min(1.0, t1 / len1)) * len1
+    t2 = max(0.0, min(1.0, t2 / len2)) * len2
 
     # Closest points on each axis
-    closest1 = cyl1.start + d1.normalized() * t1 if len1 > 0 else cyl1.start
-    closest2 = cyl2.start + d2.normalized() * t2 if len2 > 0 else cyl2.start
+    c1x, c1y, c1z = ax + u1x * t1, ay + u1y * t1, az + u1z * t1
+    c2x, c2y, c2z = cx + u2x * t2, cy + u2y * t2, cz + u2z * t2
 
-    # Distance between closest points
-    distance = (closest1 - closest2).length()
-    combined_radius = cyl1.radius + cyl2.radius
+    # Compare squared distance; sqrt only for the reported penetration
+    gx, gy, gz = c1x - c2x, c1y - c2y, c1z - c2z
+    dist_sq = gx * gx + gy * gy + gz * gz
+    combined_radius = r1 + r2
 
-    if distance < combined_radius:
-        penetration = combined_radius - distance
-        intersection_point = closest1 + (closest2 - closest1) * 0.5
-        return (True, penetration, intersection_point)
+    if dist_sq < combined_radius * combined_radius:
+        return (
+            True,
+            combined_radius - math.sqrt(dist_sq),
+            c1x + (c2x - c1x) * 0.5,
+            c1y + (c2y - c1y) * 0.5,
+            c1z + (c2z - c1z) * 0.5
+        )
 
-    return (False, None, None)
+    return False, 0.0, 0.0, 0.0, 0.0
 
 
-def cylinder_box_intersection(
-    cyl: Cylinder,
-    box: Box
-) -> Tuple[bool, Optional[float], Optional[Point3D]]:
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def segment_box_closest(
+    sx: float, sy: float, sz: float,
+    dx: float, dy: float, dz: float,
+    box_min: Tuple[float, float, float],
+    box_max: Tuple[float, float, float]
+) -> Tuple[float, float]:
     """
-    Detect intersection between cylinder and axis-aligned box.
-    Uses sampling along cylinder axis.
+    Closest approach of segment start + t·d (t in [0, 1]) to an AABB.
+
+    The squared distance to the box is a convex piecewise quadratic in t
+    with breaks where the segment crosses a slab face. Each piece is
+    minimized in closed form; ties keep the smallest t.
+
+    box_min and box_max must be float tuples (numba indexes them with
+    a loop variable, which needs a homogeneous tuple).
+
+    Returns: (squared distance, parameter t)
     """
-    d = cyl.end - cyl.start
-    length = d.length()
+    start = (float(sx), float(sy), float(sz))
+    direction = (float(dx), float(dy), float(dz))
+
+    breaks = [0.0, 1.0]
+    for a in range(3):
+        if direction[a] != 0:
+            for face in (box_min[a], box_max[a]):
+                t = (face - start[a]) / direction[a]
+                if 0.0 < t < 1.0:
+                    breaks.append(t)
+    breaks.sort()
+
+    best_sq = math.inf
+    best_t = 0.0
+
+    for ta, tb in zip(breaks, breaks[1:]):
+        # Axes outside their slab over this piece contribute (d·t - q)²
+        mid = 0.5 * (ta + tb)
+        dd = 0.0
+        dq = 0.0
+        for a in range(3):
+            p = start[a] + direction[a] * mid
+            if p < box_min[a]:
+                q = box_min[a] - start[a]
+            elif p > box_max[a]:
+                q = box_max[a] - start[a]
+            else:
+                continue
+            dd += direction[a] * direction[a]
+            dq += direction[a] * q
 
-    bounds = box.get_bounds()
+        t = min(max(dq / dd, ta), tb) if dd > 0 else ta
 
-    if length == 0:
-        # Point cylinder
-        closest = Point3D(
-            max(bounds.min_point.x, min(cyl.start.x, bounds.max_point.x)),
-            max(bounds.min_point.y, min(cyl.start.y, bounds.max_point.y)),
-            max(bounds.min_point.z, min(cyl.start.z, bounds.max_point.z))
-        )
-        dist = (cyl.start - closest).length()
-        if dist < cyl.radius:
-            return (True, cyl.radius - dist, cyl.start)
-        return (False, None, None)
+        sq = 0.0
+        for a in range(3):
+            p = start[a] + direction[a] * t
+            g = p - max(box_min[a], min(p, box_max[a]))
+            sq += g * g
+
+        if sq < best_sq:
+            best_sq = sq
+            best_t = t
+
+    return best_sq, best_t
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _cyl_box_sampled_kernel(sx, sy, sz, ex, ey, ez, radius, bx0, by0, bz0, bx1, by1, bz1):
+    """Cylinder/box test by sampling along the cylinder axis."""
+    dx, dy, dz = ex - sx, ey - sy, ez - sz
+    length = math.sqrt(dx * dx + dy * dy + dz * dz)
 
     # Sample points along cylinder axis
-    num_samples = max(10, int(length / cyl.radius))
-    min_clearance = float('inf')
-    min_point = None
+    num_samples = max(10, int(length / radius)) if math.isfinite(length) else 10
+    radius_sq = radius * radius
+    min_sq = math.inf
+    min_x = min_y = min_z = 0.0
 
     for i in range(num_samples + 1):
         t = i / num_samples
-        point = cyl.start + d * t
+        px, py, pz = sx + dx * t, sy + dy * t, sz + dz * t
 
         # Find closest point on box surface
-        closest = Point3D(
-            max(bounds.min_point.x, min(point.x, bounds.max_point.x)),
-            max(bounds.min_point.y, min(point.y, bounds.max_point.y)),
-            max(bounds.min_point.z, min(point.z, bounds.max_point.z))
-        )
+        cx = max(bx0, min(px, bx1))
+        cy = max(by0, min(py, by1))
+        cz = max(bz0, min(pz, bz1))
 
-        dist = (point - closest).length()
+        gx, gy, gz = px - cx, py - cy, pz - cz
+        dist_sq = gx * gx + gy * gy + gz * gz
 
-        if dist < min_clearance:
-            min_clearance = dist
-            min_point = closest
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+            min_x, min_y, min_z = cx, cy, cz
 
-        if dist < cyl.radius:
-            penetration = cyl.radius - dist
-            return (True, penetration, closest)
+        if dist_sq < radius_sq:
+            return True, radius - math.sqrt(dist_sq), cx, cy, cz
 
     # No intersection but return closest approach
-    return (False, cyl.radius - min_clearance, min_point)
+    return False, radius - math.sqrt(min_sq), min_x, min_y, min_z
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _vertical_cyl_box_kernel(x, y, sz, ez, radius, bx0, by0, bz0, bx1, by1, bz1):
+    """
+    Vertical cylinder (axis x, y from sz to ez) against the AABB [b0, b1].
+
+    The xy gap to the box rectangle is constant along the axis, so the
+    closest approach is that gap plus the 1D gap between the z ranges,
+    taken at the axis point nearest the start. Same returns as
+    _cyl_box_kernel.
+    """
+    # Axis point nearest the start that lies in the box's z range (or
+    # the axis end closest to it when the z ranges do not overlap)
+    pz = min(max(max(bz0, min(sz, bz1)), min(sz, ez)), max(sz, ez))
+
+    cx = max(bx0, min(x, bx1))
+    cy = max(by0, min(y, by1))
+    cz = max(bz0, min(pz, bz1))
+    gx, gy, gz = x - cx, y - cy, pz - cz
+    dist = math.sqrt(gx * gx + gy * gy + gz * gz)
+
+    return dist < radius, radius - dist, cx, cy, cz
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _cyl_box_kernel(sx, sy, sz, ex, ey, ez, radius, bx0, by0, bz0, bx1, by1, bz1):
+    """
+    Cylinder s-e (radius) against the AABB [b0, b1].
+
+    Returns (hit, penetration, ix, iy, iz). Penetration is negative
+    clearance when there is no hit, and NaN when there is no result.
+    """
+    dx, dy, dz = ex - sx, ey - sy, ez - sz
+    length_sq = dx * dx + dy * dy + dz * dz
+
+    if length_sq == 0:
+        # Point cylinder
+        cx = max(bx0, min(sx, bx1))
+        cy = max(by0, min(sy, by1))
+        cz = max(bz0, min(sz, bz1))
+        gx, gy, gz = sx - cx, sy - cy, sz - cz
+        dist_sq = gx * gx + gy * gy + gz * gz
+        if dist_sq < radius * radius:
+            return True, radius - math.sqrt(dist_sq), sx, sy, sz
+        return False, math.nan, 0.0, 0.0, 0.0
+
+    if not math.isfinite(length_sq + bx0 + by0 + bz0 + bx1 + by1 + bz1):
+        return _cyl_box_sampled_kernel(
+            sx, sy, sz, ex, ey, ez, radius, bx0, by0, bz0, bx1, by1, bz1
+        )
+
+    if dx == 0.0 and dy == 0.0:
+        return _vertical_cyl_box_kernel(
+            sx, sy, sz, ez, radius, bx0, by0, bz0, bx1, by1, bz1
+        )
+
+    dist_sq, t = segment_box_closest(
+        sx, sy, sz, dx, dy, dz,
+        (float(bx0), float(by0), float(bz0)),
+        (float(bx1), float(by1), float(bz1))
+    )
+    dist = math.sqrt(dist_sq)
+
+    # Closest point on box surface
+    px, py, pz = sx + dx * t, sy + dy * t, sz + dz * t
+    cx = max(bx0, min(px, bx1))
+    cy = max(by0, min(py, by1))
+    cz = max(bz0, min(pz, bz1))
+
+    # Negative penetration is the clearance at closest approach
+    return dist < radius, radius - dist, cx, cy, cz
+
+
+@njit(parallel=True, cache=True, fastmath=_FASTMATH, boundscheck=False)
+def detect_all_clashes_jit(
+    rod_idx, other_idx, kinds, starts, ends, radii, box_mins, box_maxs
+):
+    """
+    Narrowphase for many (rod, element) candidate pairs in parallel.
+
+    kinds, starts/ends/radii (cylinders) and box_mins/box_maxs (boxes)
+    are indexed by element position. Returns per pair
+    (has result, penetration, intersection points (P, 3)), matching
+    cylinder_cylinder_intersection / cylinder_box_intersection.
+    """
+    n = rod_idx.shape[0]
+    has_result = np.zeros(n, dtype=np.bool_)
+    penetration = np.zeros(n)
+    points = np.zeros((n, 3))
+
+    for k in prange(n):
+        r = rod_idx[k]
+        o = other_idx[k]
+
+        if kinds[r] != _KIND_CYLINDER:
+            continue
+
+        if kinds[o] == _KIND_CYLINDER:
+            hit, pen, x, y, z = _cyl_cyl_kernel(
+                starts[r, 0], starts[r, 1], starts[r, 2],
+                ends[r, 0], ends[r, 1], ends[r, 2], radii[r],
+                starts[o, 0], starts[o, 1], starts[o, 2],
+                ends[o, 0], ends[o, 1], ends[o, 2], radii[o]
+            )
+            ok = hit
+        elif kinds[o] == _KIND_BOX:
+            hit, pen, x, y, z = _cyl_box_kernel(
+                starts[r, 0], starts[r, 1], starts[r, 2],
+                ends[r, 0], ends[r, 1], ends[r, 2], radii[r],
+                box_mins[o, 0], box_mins[o, 1], box_mins[o, 2],
+                box_maxs[o, 0], box_maxs[o, 1], box_maxs[o, 2]
+            )
+            ok = not math.isnan(pen)
+        else:
+            continue
+
+        has_result[k] = ok
+        penetration[k] = pen
+        points[k, 0] = x
+        points[k, 1] = y
+        points[k, 2] = z
+
+    return has_result, penetration, points
+
+
+def distance_point_to_line_segment(
+    point: Point3D,
+    line_start: Point3D,
+    line_end: Point3D
+) -> Tuple[float, float]:
+    """
+    Calculate distance from point to line segment.
+
+    Returns: (distance, parameter t along line)
+    """
+    return _point_segment_kernel(
+        point.x, point.y, point.z,
+        line_start.x, line_start.y, line_start.z,
+        line_end.x, line_end.y, line_end.z
+    )
+
+
+def cylinder_cylinder_intersection(
+    cyl1: Cylinder,
+    cyl2: Cylinder
+) -> Tuple[bool, Optional[float], Optional[Point3D]]:
+    """
+    Detect intersection between two finite cylinders.
+
+    Returns: (intersects, penetration_depth, intersection_point)
+    """
+    hit, penetration, x, y, z = _cyl_cyl_kernel(
+        cyl1.start.x, cyl1.start.y, cyl1.start.z,
+        cyl1.end.x, cyl1.end.y, cyl1.end.z, cyl1.radius,
+        cyl2.start.x, cyl2.start.y, cyl2.start.z,
+        cyl2.end.x, cyl2.end.y, cyl2.end.z, cyl2.radius
+    )
+
+    if hit:
+        return (True, penetration, Point3D(x, y, z))
+
+    return (False, None, None)
+
+
+def cyl_vs_cyl_batch(
+    rod_start: np.ndarray,
+    rod_end: np.ndarray,
+    rod_r: float,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    radii: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Detect intersection between one cylinder and K cylinders at once.
+
+    Same closest-point formula as cylinder_cylinder_intersection,
+    evaluated over (K, 3) arrays of candidate axis endpoints.
+
+    Returns: (intersects mask (K,), penetration (K,), intersection points (K, 3))
+    Penetration and points are only meaningful where the mask is True.
+    """
+    d1 = rod_end - rod_start
+    d2 = ends - starts
+
+    len1 = math.sqrt(d1[0] * d1[0] + d1[1] * d1[1] + d1[2] * d1[2])
+    len2 = np.sqrt(np.einsum('ij,ij->i', d2, d2))
+
+    k = starts.shape[0]
+    valid = len2 != 0
+    if len1 == 0 or not valid.any():
+        return np.zeros(k, dtype=np.bool_), np.zeros(k), np.zeros((k, 3))
+
+    safe_len2 = np.where(valid, len2, 1.0)
+
+    u1 = d1 / len1
+    u2 = d2 / safe_len2[:, None]
+
+    w = rod_start - starts
+    # Row-wise dot products: one rod against K candidates, so each is a
+    # single (K, 3) contraction rather than three strided passes
+    a = u1[0] * u1[0] + u1[1] * u1[1] + u1[2] * u1[2]
+    b = np.einsum('ij,j->i', u2, u1)
+    c = np.einsum('ij,ij->i', u2, u2)
+    d = np.einsum('ij,j->i', w, u1)
+    e = np.einsum('ij,ij->i', u2, w)
+
+    denom = a * c - b * b
+    parallel = np.abs(denom) < 1e-10
+    safe_denom = np.where(parallel, 1.0, denom)
+    safe_c = np.where(c != 0, c, 1.0)
+
+    t1 = np.where(parallel, 0.0, (b * e - c * d) / safe_denom)
+    t2 = np.where(
+        parallel,
+        np.where(c != 0, -e / safe_c, 0.0),
+        (a * e - b * d) / safe_denom
+    )
+
+    # Clamp to segment bounds
+    t1 = np.clip(t1 / len1, 0, 1) * len1
+    t2 = np.clip(t2 / safe_len2, 0, 1) * safe_len2
+
+    # Closest points on each axis
+    closest1 = rod_start + u1 * t1[:, None]
+    closest2 = starts + u2 * t2[:, None]
+
+    g = closest1 - closest2
+    dist_sq = np.einsum('ij,ij->i', g, g)
+    combined_radius = rod_r + radii
+
+    mask = valid & (dist_sq < combined_radius * combined_radius)
+    penetration = combined_radius - np.sqrt(dist_sq)
+    points = closest1 + (closest2 - closest1) * 0.5
+
+    return mask, penetration, points
+
+
+def cyl_vs_box_batch(
+    rod_start: np.ndarray,
+    rod_end: np.ndarray,
+    rod_r: float,
+    box_mins: np.ndarray,
+    box_maxs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Test one cylinder against K axis-aligned boxes at once.
+
+    Vertical cylinders are evaluated with the same xy/z gap formula as
+    _vertical_cyl_box_kernel over (K, 3) arrays; other orientations
+    call _cyl_box_kernel per box.
+
+    Returns: (has result mask (K,), penetration (K,), closest points (K, 3))
+    Penetration is negative clearance where there is no hit.
+    """
+    k = box_mins.shape[0]
+    d = rod_end - rod_start
+
+    if (
+        d[0] == 0 and d[1] == 0 and d[2] != 0
+        and np.isfinite(d[2]) and np.isfinite(box_mins).all()
+        and np.isfinite(box_maxs).all()
+    ):
+        sx, sy, sz = rod_start.tolist()
+        ez = float(rod_end[2])
+        pz = np.clip(np.clip(sz, box_mins[:, 2], box_maxs[:, 2]), min(sz, ez), max(sz, ez))
+
+        closest = np.empty((k, 3))
+        closest[:, 0] = np.clip(sx, box_mins[:, 0], box_maxs[:, 0])
+        closest[:, 1] = np.clip(sy, box_mins[:, 1], box_maxs[:, 1])
+        closest[:, 2] = np.clip(pz, box_mins[:, 2], box_maxs[:, 2])
+
+        gx = sx - closest[:, 0]
+        gy = sy - closest[:, 1]
+        gz = pz - closest[:, 2]
+        penetration = rod_r - np.sqrt(gx * gx + gy * gy + gz * gz)
+        return np.ones(k, dtype=np.bool_), penetration, closest
+
+    has_result = np.zeros(k, dtype=np.bool_)
+    penetration = np.zeros(k)
+    closest = np.zeros((k, 3))
+    sx, sy, sz = rod_start.tolist()
+    ex, ey, ez = rod_end.tolist()
+
+    for j, (b0, b1) in enumerate(zip(box_mins.tolist(), box_maxs.tolist())):
+        hit, pen, x, y, z = _cyl_box_kernel(sx, sy, sz, ex, ey, ez, rod_r, *b0, *b1)
+        if not math.isnan(pen):
+            has_result[j] = True
+            penetration[j] = pen
+            closest[j] = (x, y, z)
+
+    return has_result, penetration, closest
+
+
+def cylinder_box_intersection(
+    cyl: Cylinder,
+    box: Box,
+    bounds: Optional[BoundingBox] = None
+) -> Tuple[bool, Optional[float], Optional[Point3D]]:
+    """
+    Detect intersection between cylinder and axis-aligned box.
+
+    Uses the closed-form closest approach of the cylinder axis to the
+    box (a 2D rectangle gap plus z gap for vertical rods); falls back to
+    sampling along the axis for non-finite input.
+    Pass precomputed box bounds to skip recomputing them.
+    """
+    if bounds is None:
+        bounds = box.bounds
+
+    hit, penetration, x, y, z = _cyl_box_kernel(
+        cyl.start.x, cyl.start.y, cyl.start.z,
+        cyl.end.x, cyl.end.y, cyl.end.z, cyl.radius,
+        bounds.min_point.x, bounds.min_point.y, bounds.min_point.z,
+        bounds.max_point.x, bounds.max_point.y, bounds.max_point.z
+    )
+
+    if math.isnan(penetration):
+        return (False, None, None)
+
+    # No intersection still reports the closest approach
+    return (hit, penetration, Point3D(x, y, z))
+
+
+def _str_order(
+    order: np.ndarray,
+    centers: np.ndarray,
+    fanout: int,
+    axis: int = 0
+) -> np.ndarray:
+    """
+    Sort-Tile-Recursive ordering of box indices.
+
+    Sorts by center along axis, cuts into slabs of whole leaves,
+    then recurses on the next axis within each slab.
+    """
+    order = order[np.argsort(centers[order, axis], kind='stable')]
+    n = order.size
+    if axis == 2 or n <= fanout:
+        return order
+
+    leaves = -(-n // fanout)
+    slabs = math.ceil(leaves ** (1.0 / (3 - axis)))
+    slab_size = fanout * -(-leaves // slabs)
+
+    return np.concatenate([
+        _str_order(order[i:i + slab_size], centers, fanout, axis + 1)
+        for i in range(0, n, slab_size)
+    ])
+
+
+def _to_float32(values: np.ndarray, round_down: bool) -> np.ndarray:
+    """Cast to float32, rounding toward -inf (round_down) or +inf."""
+    out = values.astype(np.float32)
+    if round_down:
+        moved = out > values
+        out[moved] = np.nextafter(out[moved], np.float32(-np.inf))
+    else:
+        moved = out < values
+        out[moved] = np.nextafter(out[moved], np.float32(np.inf))
+    return out
 
 
 class SpatialIndex:
-    """Simple spatial index for clash detection (without rtree dependency)."""
+    """
+    Spatial index for clash detection.
+
+    Bounds are bulk loaded into a Sort-Tile-Recursive (STR) packed R-tree
+    on the first query after any insert. Nodes are stored as flat arrays
+    (node mins/maxs plus a CSR child list) and every visited node tests
+    all of its children in one vectorized comparison. Pass use_rtree=True
+    to use the rtree package instead when it is installed.
+
+    Pass slab_height_in (e.g. SLAB_HEIGHT_IN, one story) to bucket
+    elements into horizontal z-slabs instead; queries then sweep only the
+    slabs they overlap. This suits short, level-local queries; full-height
+    rod queries are pruned on all three axes by the STR tree.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        fanout: int = 16,
+        use_rtree: bool = False,
+        slab_height_in: Optional[float] = None
+    ):
         self.elements: Dict[str, SpatialElement] = {}
+        self.fanout = fanout
+        self.use_rtree = use_rtree and rtree_index is not None
+        self.slab_height_in = slab_height_in
+        self._built = False
 
     def insert(self, element: SpatialElement):
         """Insert element into index."""
         self.elements[element.element_id] = element
+        self._built = False
+
+    def build(self):
+        """Bulk load the tree from the current elements."""
+        self._ids = list(self.elements)
+        self._elements = list(self.elements.values())
+        self._positions = {element_id: i for i, element_id in enumerate(self._ids)}
+
+        bounds = np.array(
+            [element.get_bounds().to_tuple() for element in self._elements],
+            dtype=np.float64
+        ).reshape(-1, 6)
+
+        # One contiguous float32 block (mins | maxs per row) halves the
+        # bytes the AABB tests stream; rounded outward so it never shrinks
+        packed = np.empty(bounds.shape, dtype=np.float32)
+        packed[:, :3] = _to_float32(bounds[:, :3], round_down=True)
+        packed[:, 3:] = _to_float32(bounds[:, 3:], round_down=False)
+        self._bounds32 = packed
+        self._mins = packed[:, :3]
+        self._maxs = packed[:, 3:]
+
+        if self.slab_height_in:
+            self._build_zslabs()
+        elif self.use_rtree:
+            props = rtree_index.Property()
+            props.dimension = 3
+            self._rtree = rtree_index.Index(properties=props, interleaved=False)
+            for i, b in enumerate(bounds.tolist()):
+                self._rtree.insert(i, (b[0], b[3], b[1], b[4], b[2], b[5]))
+        else:
+            self._build_str()
+
+        self._built = True
+
+    def _build_zslabs(self):
+        """Bucket element positions by every z-slab their bounds overlap."""
+        h = self.slab_height_in
+        lo = np.floor(self._mins[:, 2] / h).astype(np.int64)
+        hi = np.floor(self._maxs[:, 2] / h).astype(np.int64)
+
+        by_slab: Dict[int, List[int]] = {}
+        for i, (a, b) in enumerate(zip(lo.tolist(), hi.tolist())):
+            for slab in range(a, b + 1):
+                by_slab.setdefault(slab, []).append(i)
+
+        self._by_zslab = {
+            slab: np.array(members, dtype=np.intp)
+            for slab, members in by_slab.items()
+        }
+
+    def _query_zslabs(self, qmin: np.ndarray, qmax: np.ndarray) -> np.ndarray:
+        """Sweep the z-slabs overlapping [qmin, qmax] with a vectorized AABB test."""
+        h = self.slab_height_in
+        hits = []
+
+        for slab in range(int(math.floor(qmin[2] / h)), int(math.floor(qmax[2] / h)) + 1):
+            members = self._by_zslab.get(slab)
+            if members is None:
+                continue
+            mask = np.all(
+                (self._maxs[members] >= qmin) & (self._mins[members] <= qmax), axis=1
+            )
+            hits.append(members[mask])
+
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+
+        # Dedupe elements spanning several slabs; reported in insertion order
+        return np.unique(np.concatenate(hits))
+
+    def _build_str(self):
+        """Pack leaves with STR, then pack each parent level the same way."""
+        fanout = self.fanout
+        node_mins = []
+        node_maxs = []
+        node_children = []
+        node_is_leaf = []
+
+        # Level 0 groups elements; higher levels group the level below
+        mins, maxs = self._mins, self._maxs
+        level_ids = np.arange(len(self._elements))
+        is_leaf = True
+
+        while True:
+            order = _str_order(
+                np.arange(level_ids.size), (mins + maxs) * 0.5, fanout
+            )
+            first = len(node_mins)
+
+            for i in range(0, order.size, fanout):
+                group = order[i:i + fanout]
+                node_mins.append(mins[group].min(axis=0))
+                node_maxs.append(maxs[group].max(axis=0))
+                node_children.append(level_ids[group])
+                node_is_leaf.append(is_leaf)
+
+            level_ids = np.arange(first, len(node_mins))
+            if level_ids.size <= 1:
+                break
+
+            mins = np.array(node_mins[first:])
+            maxs = np.array(node_maxs[first:])
+            is_leaf = False
+
+        self._root = len(node_mins) - 1
+        self._node_mins = np.array(node_mins).reshape(-1, 3)
+        self._node_maxs = np.array(node_maxs).reshape(-1, 3)
+        self._node_is_leaf = node_is_leaf
+        self._child_ptr = np.cumsum([0] + [c.size for c in node_children])
+        self._child_idx = (
+            np.concatenate(node_children) if node_children
+            else np.empty(0, dtype=np.intp)
+        )
+
+    def _query_str(self, qmin: np.ndarray, qmax: np.ndarray) -> np.ndarray:
+        """Indices of elements whose bounds intersect [qmin, qmax]."""
+        if self._root < 0:
+            return np.empty(0, dtype=np.intp)
+
+        hits = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            children = self._child_idx[self._child_ptr[node]:self._child_ptr[node + 1]]
+
+            if self._node_is_leaf[node]:
+                mins, maxs = self._mins[children], self._maxs[children]
+            else:
+                mins, maxs = self._node_mins[children], self._node_maxs[children]
+
+            mask = np.all((maxs >= qmin) & (mins <= qmax), axis=1)
+
+            if self._node_is_leaf[node]:
+                hits.append(children[mask])
+            else:
+                stack.extend(children[mask].tolist())
+
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+
+        # Report in insertion order
+        return np.sort(np.concatenate(hits))
+
+    def bounds_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Element bounds as (mins (N, 3), maxs (N, 3)) in insertion order.
+
+        Stored as float32 rounded outward, so they may exceed the exact
+        bounds by one float32 ulp (~1e-4" at building scale).
+        """
+        if not self._built:
+            self.build()
+        return self._mins, self._maxs
+
+    def query_bounds(self, bounds: Tuple[float, ...]) -> np.ndarray:
+        """
+        Find elements whose bounds intersect the given box.
+
+        bounds is (xmin, ymin, zmin, xmax, ymax, zmax), as from
+        BoundingBox.to_tuple(). Returns element positions in insertion
+        order (the order of self.elements).
+        """
+        if not self._built:
+            self.build()
+
+        if self.use_rtree and not self.slab_height_in:
+            return np.array(sorted(self._rtree.intersection(
+                (bounds[0], bounds[3], bounds[1], bounds[4], bounds[2], bounds[5])
+            )), dtype=np.intp)
+
+        qmin = _to_float32(np.array(bounds[:3]), round_down=True)
+        qmax = _to_float32(np.array(bounds[3:]), round_down=False)
+
+        if self.slab_height_in:
+            return self._query_zslabs(qmin, qmax)
+
+        return self._query_str(qmin, qmax)
+
+    def query_candidates(
+        self,
+        bounds: Tuple[float, ...],
+        exclude_id: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Element positions intersecting bounds, minus exclude_id.
+
+        Same ordering as query_bounds; index self.elements values (or the
+        arrays from bounds_arrays) with the result.
+        """
+        hits = self.query_bounds(bounds)
+        position = self._positions.get(exclude_id)
+        if position is not None:
+            hits = hits[hits != position]
+        return hits
 
     def query_potential_clashes(
         self,
         bounds: BoundingBox,
         exclude_id: str = None
     ) -> Generator[SpatialElement, None, None]:
-        """Find elements that might clash with given bounds."""
-        for elem_id, element in self.elements.items():
-            if elem_id == exclude_id:
-                continue
-            if bounds.intersects(element.get_bounds()):
-                yield element
+        """
+        Find elements that might clash with given bounds.
+
+        Kept for existing callers; query_candidates returns the same
+        elements as an index array.
+        """
+        for i in self.query_candidates(bounds.to_tuple(), exclude_id).tolist():
+            yield self._elements[i]
+
+
+@functools.lru_cache(maxsize=None)
+def _recommendations(
+    severity: ClashSeverity,
+    element_type: ElementType
+) -> Tuple[str, ...]:
+    """Resolution recommendations for a severity and element type."""
+    recommendations = []
+
+    trade = _TRADE_MAP.get(element_type, "COORDINATION")
+
+    if severity == ClashSeverity.CRITICAL:
+        recommendations.append(
+            f"RELOCATE_MEP: Move {element_type.name} to clear rod path "
+            f"(Responsible: {trade})"
+        )
+        recommendations.append(
+            "RELOCATE_ROD: Move rod run if MEP is fixed "
+            "(Requires structural review)"
+        )
+    elif severity == ClashSeverity.MAJOR:
+        recommendations.append(
+            f"ADJUST_ROUTING: Modify {element_type.name} routing "
+            f"(Responsible: {trade})"
+        )
+    elif severity == ClashSeverity.MINOR:
+        recommendations.append(
+            "VERIFY_FIELD: Confirm clearance acceptable in field"
+        )
+
+    return tuple(recommendations)
+
+
+def _classify(penetration: float, required: float) -> Optional[ClashSeverity]:
+    """Severity for a penetration (negative = clearance), or None."""
+    if penetration > 0:
+        return ClashSeverity.CRITICAL
+
+    actual_clearance = -penetration
+
+    if actual_clearance < required:
+        if required - actual_clearance > required * 0.5:
+            return ClashSeverity.MAJOR
+        return ClashSeverity.MINOR
+
+    if actual_clearance < required * WARNING_CLEARANCE_FACTOR:
+        return ClashSeverity.WARNING
+
+    return None
+
+
+def _clash_description(
+    severity: ClashSeverity,
+    penetration: float,
+    actual: float,
+    required: float
+) -> str:
+    """Description text for a classified clash."""
+    if severity == ClashSeverity.CRITICAL:
+        return f"Hard interference: {penetration:.2f}\" overlap"
+    if severity == ClashSeverity.MAJOR:
+        return f"Clearance violation: {actual:.2f}\" vs {required:.2f}\" required"
+    if severity == ClashSeverity.MINOR:
+        return f"Minor clearance violation: {actual:.2f}\" vs {required:.2f}\" required"
+    return f"Near clearance limit: {actual:.2f}\" (min {required:.2f}\")"
 
 
 class ClashDetectionEngine:
@@ -364,14 +1204,25 @@ class ClashDetectionEngine:
         self.index = SpatialIndex()
         self.clearance_multiplier = clearance_multiplier
 
+    @property
+    def clearance_multiplier(self) -> float:
+        return self._clearance_multiplier
+
+    @clearance_multiplier.setter
+    def clearance_multiplier(self, value: float):
+        # Required clearance indexed by ElementType, rebuilt whenever
+        # the multiplier changes
+        self._clearance_multiplier = value
+        self._clearance_arr = _CLEARANCE_ARR * value
+        self._clearance_by_type = tuple(self._clearance_arr.tolist())
+
     def add_element(self, element: SpatialElement):
         """Add element to the spatial index."""
         self.index.insert(element)
 
     def get_required_clearance(self, element_type: ElementType) -> float:
         """Get required clearance for element type."""
-        base = CLEARANCE_REQUIREMENTS.get(element_type, 1.0)
-        return base * self.clearance_multiplier
+        return self._clearance_by_type[element_type]
 
     def classify_severity(
         self,
@@ -380,35 +1231,40 @@ class ClashDetectionEngine:
     ) -> Tuple[ClashSeverity, str]:
         """Classify clash severity and generate description."""
         required = self.get_required_clearance(element_type)
+        severity = _classify(penetration, required)
 
-        if penetration > 0:
-            return (
-                ClashSeverity.CRITICAL,
-                f"Hard interference: {penetration:.2f}\" overlap"
-            )
-
-        actual_clearance = -penetration
+        if severity is None:
+            return (None, "")  # No clash
 
-        if actual_clearance < required:
-            violation = required - actual_clearance
-            if violation > required * 0.5:
-                return (
-                    ClashSeverity.MAJOR,
-                    f"Clearance violation: {actual_clearance:.2f}\" vs {required:.2f}\" required"
-                )
-            else:
-                return (
-                    ClashSeverity.MINOR,
-                    f"Minor clearance violation: {actual_clearance:.2f}\" vs {required:.2f}\" required"
-                )
-
-        if actual_clearance < required * 1.5:
-            return (
-                ClashSeverity.WARNING,
-                f"Near clearance limit: {actual_clearance:.2f}\" (min {required:.2f}\")"
+        return (
+            severity,
+            _clash_description(
+                severity, max(0, penetration), -min(0, penetration), required
             )
+        )
 
-        return (None, "")  # No clash
+    def classify_severity_batch(
+        self,
+        penetration: np.ndarray,
+        element_types: np.ndarray
+    ) -> np.ndarray:
+        """
+        Classify severities for arrays of penetrations and element types.
+
+        Returns ClashSeverity codes as int8, NO_CLASH where the pair is
+        outside the warning band. Matches classify_severity element-wise.
+        """
+        penetration = np.asarray(penetration, dtype=np.float64)
+        required = self._clearance_arr[np.asarray(element_types, dtype=np.intp)]
+        actual = -np.minimum(penetration, 0.0)
+
+        severity = np.full(penetration.shape, NO_CLASH, dtype=np.int8)
+        severity[actual < required * WARNING_CLEARANCE_FACTOR] = ClashSeverity.WARNING
+        violated = actual < required
+        severity[violated] = ClashSeverity.MINOR
+        severity[violated & (required - actual > required * 0.5)] = ClashSeverity.MAJOR
+        severity[penetration > 0] = ClashSeverity.CRITICAL
+        return severity
 
     def generate_recommendations(
         self,
@@ -416,39 +1272,7 @@ class ClashDetectionEngine:
         element_type: ElementType
     ) -> List[str]:
         """Generate resolution recommendations."""
-        recommendations = []
-
-        trade_map = {
-            ElementType.HVAC_DUCT: "MECHANICAL",
-            ElementType.PLUMBING_PIPE: "PLUMBING",
-            ElementType.ELECTRICAL_CONDUIT: "ELECTRICAL",
-            ElementType.FIRE_SPRINKLER: "FIRE_PROTECTION",
-            ElementType.STRUCTURAL_BEAM: "STRUCTURAL",
-            ElementType.CABLE_TRAY: "ELECTRICAL",
-        }
-
-        trade = trade_map.get(element_type, "COORDINATION")
-
-        if severity == ClashSeverity.CRITICAL:
-            recommendations.append(
-                f"RELOCATE_MEP: Move {element_type.value} to clear rod path "
-                f"(Responsible: {trade})"
-            )
-            recommendations.append(
-                "RELOCATE_ROD: Move rod run if MEP is fixed "
-                "(Requires structural review)"
-            )
-        elif severity == ClashSeverity.MAJOR:
-            recommendations.append(
-                f"ADJUST_ROUTING: Modify {element_type.value} routing "
-                f"(Responsible: {trade})"
-            )
-        elif severity == ClashSeverity.MINOR:
-            recommendations.append(
-                "VERIFY_FIELD: Confirm clearance acceptable in field"
-            )
-
-        return recommendations
+        return list(_recommendations(severity, element_type))
 
     def check_clash(
         self,
@@ -459,14 +1283,24 @@ class ClashDetectionEngine:
         rod_geom = rod.geometry
         other_geom = other.geometry
 
+        # Early reject on bounds: cylinders only clash on overlap, boxes
+        # also report clearance up to 1.5× the required value
+        rod_bounds = rod.get_bounds()
+        if other.geom_kind == _KIND_BOX:
+            rod_bounds = rod_bounds.expand(
+                WARNING_CLEARANCE_FACTOR * self.get_required_clearance(other.element_type)
+            )
+        if not rod_bounds.intersects(other.get_bounds()):
+            return None
+
         # Determine intersection based on geometry types
-        if isinstance(other_geom, Cylinder):
+        if other.geom_kind == _KIND_CYLINDER:
             intersects, penetration, point = cylinder_cylinder_intersection(
                 rod_geom, other_geom
             )
-        elif isinstance(other_geom, Box):
+        elif other.geom_kind == _KIND_BOX:
             intersects, penetration, point = cylinder_box_intersection(
-                rod_geom, other_geom
+                rod_geom, other_geom, other.get_bounds()
             )
         else:
             return None
@@ -474,21 +1308,32 @@ class ClashDetectionEngine:
         if penetration is None:
             return None
 
-        # Classify severity
-        severity, description = self.classify_severity(
-            penetration, other.element_type
-        )
+        return self._build_clash(rod, other, penetration, point)
+
+    def _build_clash(
+        self,
+        rod: SpatialElement,
+        other: SpatialElement,
+        penetration: float,
+        point: Optional[Point3D],
+        severity: Optional[ClashSeverity] = None
+    ) -> Optional[ClashResult]:
+        """
+        Classify a rod/element proximity and build its ClashResult.
+
+        severity may be passed in when already classified in batch.
+        Description and recommendations are formatted lazily by
+        ClashResult.
+        """
+        required_clearance = self.get_required_clearance(other.element_type)
+        if severity is None:
+            severity = _classify(penetration, required_clearance)
 
         if severity is None:
             return None
 
-        required_clearance = self.get_required_clearance(other.element_type)
         actual_clearance = -penetration if penetration < 0 else 0
 
-        recommendations = self.generate_recommendations(
-            severity, other.element_type
-        )
-
         return ClashResult(
             element_1_id=rod.element_id,
             element_2_id=other.element_id,
@@ -499,36 +1344,258 @@ class ClashDetectionEngine:
             clearance_required_in=required_clearance,
             clearance_actual_in=actual_clearance,
             intersection_point=point if point else Point3D(0, 0, 0),
-            level=rod.level,
-            description=description,
-            recommendations=recommendations
+            level=rod.level
         )
 
-    def detect_all_clashes(self, clearance_buffer: float = 2.0) -> List[ClashResult]:
-        """Detect all clashes involving rod elements."""
-        clashes = []
+    def detect_all_clashes(
+        self,
+        clearance_buffer: float = 2.0,
+        workers: Optional[int] = None
+    ) -> List[ClashResult]:
+        """
+        Detect all clashes involving rod elements.
+
+        With numba installed every candidate pair is evaluated by the
+        parallel detect_all_clashes_jit kernel and `workers` is ignored.
+        Otherwise cylinder candidates are batched per rod with NumPy,
+        in-process by default. Passing workers > 1 splits the rods across
+        that many processes; process start-up and pickling cost more than
+        the batched work per pair, so this only pays off on many cores.
+        """
+        elements = list(self.index.elements.values())
+        is_rod = np.fromiter(
+            (elem.element_type == ElementType.ROD for elem in elements),
+            dtype=np.bool_,
+            count=len(elements)
+        )
+        geometry = _geometry_arrays(elements)
+        kinds = geometry[0]
+
+        # How far past its bounds each element can still be reported:
+        # boxes out to the warning clearance, cylinders only on overlap
+        reach = np.where(
+            kinds == _KIND_BOX,
+            WARNING_CLEARANCE_FACTOR * self._clearance_arr[
+                np.fromiter((elem.element_type for elem in elements),
+                            dtype=np.intp, count=len(elements))
+            ],
+            0.0
+        )
+
+        # Broadphase: candidate elements per rod
+        rod_ids = np.flatnonzero(is_rod)
+        rod_candidates = []
+        for r in rod_ids.tolist():
+            # Expand bounds for clearance check
+            rod_bounds = elements[r].get_bounds()
+            search_bounds = rod_bounds.expand(clearance_buffer)
+            candidates = self.index.query_bounds(search_bounds.to_tuple())
+
+            # Skip rod-to-rod (including the rod itself)
+            candidates = candidates[~is_rod[candidates]]
+
+            # Early reject: rod bounds grown by each candidate's reach
+            mins, maxs = self.index.bounds_arrays()
+            box = rod_bounds.to_tuple()
+            grow = reach[candidates][:, None]
+            keep = np.all(
+                (np.array(box[3:]) + grow >= mins[candidates])
+                & (np.array(box[:3]) - grow <= maxs[candidates]),
+                axis=1
+            )
+            rod_candidates.append(candidates[keep])
+
+        if NUMBA_AVAILABLE:
+            return self._narrowphase_jit(elements, rod_ids, rod_candidates, geometry)
+
+        if workers is not None and workers > 1 and rod_ids.size > 1:
+            return self._narrowphase_parallel(
+                elements, rod_ids, rod_candidates, geometry, workers
+            )
+
+        return self._narrowphase_batched(elements, rod_ids, rod_candidates, geometry)
+
+    def _narrowphase_jit(
+        self,
+        elements: List[SpatialElement],
+        rod_ids: np.ndarray,
+        rod_candidates: List[np.ndarray],
+        geometry: Tuple[np.ndarray, ...]
+    ) -> List[ClashResult]:
+        """Evaluate all candidate pairs in one parallel compiled call."""
+        counts = [c.size for c in rod_candidates]
+        if not sum(counts):
+            return []
+
+        pair_rod = np.repeat(rod_ids, counts)
+        pair_other = np.concatenate(rod_candidates)
+
+        has_result, penetration, points = detect_all_clashes_jit(
+            pair_rod, pair_other, *geometry
+        )
 
-        rods = [
-            elem for elem in self.index.elements.values()
-            if elem.element_type == ElementType.ROD
+        # Classify every pair at once; only real clashes become results
+        hits = np.flatnonzero(has_result)
+        other_types = np.fromiter(
+            (elements[i].element_type for i in pair_other[hits].tolist()),
+            dtype=np.intp, count=hits.size
+        )
+        severity = self.classify_severity_batch(penetration[hits], other_types)
+        keep = severity != NO_CLASH
+        hits, severity = hits[keep], severity[keep]
+
+        return [
+            self._build_clash(
+                elements[pair_rod[k]],
+                elements[pair_other[k]],
+                float(penetration[k]),
+                Point3D(*points[k].tolist()),
+                _SEVERITY_BY_CODE[sev]
+            )
+            for k, sev in zip(hits.tolist(), severity.tolist())
         ]
 
-        for rod in rods:
-            # Expand bounds for clearance check
-            search_bounds = rod.get_bounds().expand(clearance_buffer)
+    def _narrowphase_batched(
+        self,
+        elements: List[SpatialElement],
+        rod_ids: np.ndarray,
+        rod_candidates: List[np.ndarray],
+        geometry: Tuple[np.ndarray, ...]
+    ) -> List[ClashResult]:
+        """
+        Batch candidates per rod and geometry kind with NumPy.
+
+        Each rod's candidates are split into cylinder and box groups, each
+        evaluated by one batch call and classified together. Small groups
+        and non-cylinder rods take the scalar check_clash path.
+        """
+        kinds, starts, ends, radii, box_mins, box_maxs = geometry
+        element_types = np.fromiter(
+            (elem.element_type for elem in elements),
+            dtype=np.intp, count=len(elements)
+        )
+        clashes = []
 
-            for other in self.index.query_potential_clashes(
-                search_bounds, exclude_id=rod.element_id
-            ):
-                if other.element_type == ElementType.ROD:
-                    continue  # Skip rod-to-rod
+        for r, candidates in zip(rod_ids.tolist(), rod_candidates):
+            rod = elements[r]
+
+            if kinds[r] != _KIND_CYLINDER or candidates.size < BATCH_MIN_CANDIDATES:
+                for i in candidates.tolist():
+                    clash = self.check_clash(rod, elements[i])
+                    if clash:
+                        clashes.append(clash)
+                continue
+
+            cyl_idx = candidates[kinds[candidates] == _KIND_CYLINDER]
+            box_idx = candidates[kinds[candidates] == _KIND_BOX]
+
+            cyl_hit, cyl_pen, cyl_pts = cyl_vs_cyl_batch(
+                starts[r], ends[r], radii[r],
+                starts[cyl_idx], ends[cyl_idx], radii[cyl_idx]
+            )
+            box_ok, box_pen, box_pts = cyl_vs_box_batch(
+                starts[r], ends[r], radii[r],
+                box_mins[box_idx], box_maxs[box_idx]
+            )
+
+            # Merge both kinds back into candidate (insertion) order
+            idx = np.concatenate((cyl_idx[cyl_hit], box_idx[box_ok]))
+            order = np.argsort(idx, kind='stable')
+            idx = idx[order]
+            penetration = np.concatenate((cyl_pen[cyl_hit], box_pen[box_ok]))[order]
+            points = np.concatenate((cyl_pts[cyl_hit], box_pts[box_ok]))[order]
 
-                clash = self.check_clash(rod, other)
-                if clash:
-                    clashes.append(clash)
+            severity = self.classify_severity_batch(penetration, element_types[idx])
+            keep = severity != NO_CLASH
+
+            for i, pen, pt, sev in zip(
+                idx[keep].tolist(), penetration[keep].tolist(),
+                points[keep].tolist(), severity[keep].tolist()
+            ):
+                clashes.append(self._build_clash(
+                    rod, elements[i], pen, Point3D(*pt), _SEVERITY_BY_CODE[sev]
+                ))
 
         return clashes
 
+    def _narrowphase_parallel(
+        self,
+        elements: List[SpatialElement],
+        rod_ids: np.ndarray,
+        rod_candidates: List[np.ndarray],
+        geometry: Tuple[np.ndarray, ...],
+        workers: int
+    ) -> List[ClashResult]:
+        """Run _narrowphase_batched over chunks of rods in worker processes."""
+        # A few chunks per worker evens out rods with many candidates;
+        # results come back in chunk order, matching the serial path
+        n_chunks = min(rod_ids.size, 4 * workers)
+        bounds = np.linspace(0, rod_ids.size, n_chunks + 1).astype(np.intp)
+        chunks = [
+            (rod_ids[lo:hi], rod_candidates[lo:hi])
+            for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        ]
+
+        # Scene data is shipped once per worker, not once per chunk
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_narrowphase_worker,
+            initargs=(self.clearance_multiplier, elements, geometry)
+        ) as executor:
+            results = executor.map(_narrowphase_chunk, *zip(*chunks))
+            return [clash for chunk in results for clash in chunk]
+
+
+# Per-process state for _narrowphase_parallel workers
+_worker_scene = None
+
+
+def _init_narrowphase_worker(
+    clearance_multiplier: float,
+    elements: List[SpatialElement],
+    geometry: Tuple[np.ndarray, ...]
+):
+    global _worker_scene
+    _worker_scene = (ClashDetectionEngine(clearance_multiplier), elements, geometry)
+
+
+def _narrowphase_chunk(
+    rod_ids: np.ndarray,
+    rod_candidates: List[np.ndarray]
+) -> List[ClashResult]:
+    engine, elements, geometry = _worker_scene
+    return engine._narrowphase_batched(elements, rod_ids, rod_candidates, geometry)
+
+
+def _geometry_arrays(elements: List[SpatialElement]) -> Tuple[np.ndarray, ...]:
+    """
+    Flatten element geometry into arrays indexed by element position.
+
+    Returns: (kinds, cylinder starts, cylinder ends, cylinder radii,
+    box mins, box maxs)
+    """
+    n = len(elements)
+    kinds = np.full(n, _KIND_OTHER, dtype=np.int8)
+    starts = np.zeros((n, 3))
+    ends = np.zeros((n, 3))
+    radii = np.zeros(n)
+    box_mins = np.zeros((n, 3))
+    box_maxs = np.zeros((n, 3))
+
+    for i, elem in enumerate(elements):
+        geom = elem.geometry
+        kinds[i] = elem.geom_kind
+        if elem.geom_kind == _KIND_CYLINDER:
+            starts[i] = (geom.start.x, geom.start.y, geom.start.z)
+            ends[i] = (geom.end.x, geom.end.y, geom.end.z)
+            radii[i] = geom.radius
+        elif elem.geom_kind == _KIND_BOX:
+            bounds = elem.get_bounds().to_tuple()
+            box_mins[i] = bounds[:3]
+            box_maxs[i] = bounds[3:]
+
+    return kinds, starts, ends, radii, box_mins, box_maxs
+
 
 def print_clash_report(clashes: List[ClashResult]):
     """Print formatted clash detection report."""
@@ -541,7 +1608,7 @@ def print_clash_report(clashes: List[ClashResult]):
         return
 
     # Group by severity
-    by_severity = {s: [] for s in ClashSeverity}
+    by_severity = defaultdict(list)
     for clash in clashes:
         by_severity[clash.severity].append(clash)
 
@@ -551,7 +1618,7 @@ def print_clash_report(clashes: List[ClashResult]):
     for severity in ClashSeverity:
         count = len(by_severity[severity])
         if count > 0:
-            print(f"  {severity.value}: {count}")
+            print(f"  {severity.name}: {count}")
     print(f"  TOTAL: {len(clashes)}")
 
     # Details
@@ -560,12 +1627,12 @@ def print_clash_report(clashes: List[ClashResult]):
             continue
 
         print(f"\n\n{'=' * 70}")
-        print(f"{severity.value} CLASHES")
+        print(f"{severity.name} CLASHES")
         print("=" * 70)
 
         for i, clash in enumerate(by_severity[severity], 1):
             print(f"\n[{i}] {clash.element_1_id} vs {clash.element_2_id}")
-            print(f"    Type: {clash.element_2_type.value}")
+            print(f"    Type: {clash.element_2_type.name}")
             print(f"    Level: {clash.level}")
             print(f"    {clash.description}")
             print(f"    Location: ({clash.intersection_point.x:.1f}, "
@@ -713,11 +1780,16 @@ if __name__ == "__main__":
     print(f"\n{'Rod Run':<12}{'Clashes':<10}{'Critical':<10}{'Major':<10}{'Minor'}")
     print("-" * 70)
 
+    by_rod = defaultdict(list)
+    for clash in clashes:
+        by_rod[clash.element_1_id].append(clash)
+
     for rod in rods:
-        rod_clashes = [c for c in clashes if c.element_1_id == rod.element_id]
-        critical = sum(1 for c in rod_clashes if c.severity == ClashSeverity.CRITICAL)
-        major = sum(1 for c in rod_clashes if c.severity == ClashSeverity.MAJOR)
-        minor = sum(1 for c in rod_clashes if c.severity == ClashSeverity.MINOR)
+        rod_clashes = by_rod[rod.element_id]
+        counts = Counter(c.severity for c in rod_clashes)
+        critical = counts[ClashSeverity.CRITICAL]
+        major = counts[ClashSeverity.MAJOR]
+        minor = counts[ClashSeverity.MINOR]
         print(f"{rod.element_id:<12}{len(rod_clashes):<10}{critical:<10}{major:<10}{minor}")
 
     print()
@@ -5,9 +5,24 @@ Demonstrates the weighted multi-factor confidence scoring model
 for CTR design projects.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field, astuple
+from typing import List, Dict, Optional, TextIO
 from enum import Enum
+import io
+import os
+import sys
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as a script (python src/examples/<name>.py): resolve the
+    # relative imports below from the repository root (PEP 366)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))))
+    __package__ = "src.examples"
+
+from ..utils.jit import njit
 
 
 class RiskClassification(Enum):
@@ -24,28 +39,99 @@ class PEReviewIntensity(Enum):
     FULL_RECALC = "FULL_RECALC"
 
 
-@dataclass
+# Score thresholds between risk levels, ascending
+_RISK_THRESHOLDS = (50.0, 70.0, 85.0)
+
+# Risk classifications and their report strings by level
+# (0 = LOW ... 3 = CRITICAL)
+_RISK_BY_LEVEL = tuple(RiskClassification)
+_RISK_NAMES = tuple(risk.value for risk in _RISK_BY_LEVEL)
+
+# PE review (intensity, scope, time estimate) by risk level; intensity
+# is stored as its report string
+_PE_TABLE = (
+    (
+        PEReviewIntensity.STANDARD.value,
+        "Spot-check critical connections, verify governing load case, "
+        "review representative calculations",
+        "2-4 hours",
+    ),
+    (
+        PEReviewIntensity.ENHANCED.value,
+        "Review all rod runs, verify load path continuity, "
+        "check anchorage design, validate shrinkage calculations",
+        "4-8 hours",
+    ),
+    (
+        PEReviewIntensity.DETAILED.value,
+        "Full calculation review, verify all assumptions, "
+        "field-verify drawing interpretations, check all code references",
+        "1-2 days",
+    ),
+    (
+        PEReviewIntensity.FULL_RECALC.value,
+        "Independent recalculation recommended, significant uncertainty "
+        "identified, manual verification of all inputs required",
+        "2-5 days",
+    ),
+)
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Element-wise round(value, ndigits) over an array.
+
+    np.round rounds value * 10**ndigits with rint, which disagrees with
+    round()'s exact decimal rounding right at ties; those few entries
+    are redone with round() so results match the scalar builtin.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.round(values, ndigits)
+
+    scaled = values * 10.0 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        flat_values, flat_out = values.reshape(-1), out.reshape(-1)
+        for i in np.flatnonzero(near_tie).tolist():
+            flat_out[i] = round(float(flat_values[i]), ndigits)
+    return out
+
+
+def _risk_level(score: float) -> int:
+    """Risk level for a 0-100 score: 0 = LOW (>= 85) ... 3 = CRITICAL (< 50)."""
+    return len(_RISK_THRESHOLDS) - bisect_right(_RISK_THRESHOLDS, score)
+
+
+@dataclass(slots=True)
 class ComponentScore:
-    """Score contribution from a single pipeline component."""
+    """
+    Score contribution from a single pipeline component.
+
+    weighted_contribution and effective_score are computed once at
+    construction; scores are recorded once by add_component_score and
+    not edited afterwards.
+    """
     component_name: str
     base_weight: float
     raw_score: float  # 0-1
     penalty_factor: float = 1.0
-    flags: List[str] = field(default_factory=list)
+    flags: Optional[List[str]] = None  # None when there are no flags
     details: str = ""
+    weighted_contribution: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+    effective_score: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
 
-    @property
-    def weighted_contribution(self) -> float:
-        """Calculate weighted score contribution."""
-        return self.base_weight * self.raw_score * self.penalty_factor
-
-    @property
-    def effective_score(self) -> float:
-        """Calculate effective score after penalties."""
-        return self.raw_score * self.penalty_factor
+    def __post_init__(self):
+        self.weighted_contribution = (
+            self.base_weight * self.raw_score * self.penalty_factor
+        )
+        self.effective_score = self.raw_score * self.penalty_factor
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectFactors:
     """Project-level factors affecting confidence."""
     drawing_clarity: float  # 0-1 (1 = crystal clear)
@@ -58,6 +144,98 @@ class ProjectFactors:
     manual_override_count: int  # number of manual corrections
 
 
+def _category_masks(
+    components: Dict[str, float],
+    categories: Dict[str, tuple]
+) -> Dict[str, np.ndarray]:
+    """Read-only boolean component mask per category, in components order."""
+    order = list(components)
+    masks = {}
+    for category, names in categories.items():
+        mask = np.isin(order, names)
+        mask.flags.writeable = False
+        masks[category] = mask
+    return masks
+
+
+@njit(cache=True)
+def _weighted_mean_kernel(weights, raw, penalty, order, mask):
+    """
+    Weighted mean of raw * penalty over the masked components.
+
+    Terms are summed in the given order of component indices (the order
+    the scores were added), so the float sums and their rounding match
+    summing the ComponentScore contributions one by one.
+    """
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for k in range(order.shape[0]):
+        i = order[k]
+        if mask[i]:
+            total_weight += weights[i]
+            weighted_sum += weights[i] * raw[i] * penalty[i]
+
+    if total_weight <= 0:
+        return 0.0
+    return weighted_sum / total_weight
+
+
+@njit(cache=True)
+def _factor_adjustment_kernel(factors):
+    """
+    Adjustment multiplier from the 8 ProjectFactors values (field order);
+    1.0 for an empty array.
+    """
+    if factors.shape[0] == 0:
+        return 1.0
+
+    # Positive factors (boost score)
+    positive = (
+        0.10 * factors[0] +  # drawing_clarity
+        0.10 * factors[1] +  # schedule_completeness
+        0.15 * factors[2] +  # load_path_continuity
+        0.10 * factors[4]    # code_compliance_certainty
+    )
+
+    # Negative factors (reduce score)
+    negative = (
+        min(0.20, factors[3] * 0.05) +  # conflict_density
+        min(0.15, factors[5] * 0.01) +  # ambiguity_count
+        min(0.15, factors[6] * 0.01) +  # assumption_count
+        min(0.10, factors[7] * 0.02)    # manual_override_count
+    )
+
+    # Bounded adjustment factor
+    return max(0.5, min(1.2, 1.0 + positive - negative))
+
+
+def _factor_adjustment_batch(factors: np.ndarray) -> np.ndarray:
+    """
+    Factor adjustment for an (N, 8) array of ProjectFactors rows.
+
+    Vectorized form of ConfidenceScoreEngine._calculate_factor_adjustment.
+    """
+    (clarity, completeness, continuity, conflict_density, certainty,
+     ambiguities, assumptions, overrides) = np.asarray(
+        factors, dtype=np.float64
+    ).reshape(-1, 8).T
+
+    positive = (
+        0.10 * clarity +
+        0.10 * completeness +
+        0.15 * continuity +
+        0.10 * certainty
+    )
+    negative = (
+        np.minimum(0.20, conflict_density * 0.05) +
+        np.minimum(0.15, ambiguities * 0.01) +
+        np.minimum(0.15, assumptions * 0.01) +
+        np.minimum(0.10, overrides * 0.02)
+    )
+
+    return np.clip(1.0 + positive - negative, 0.5, 1.2)
+
+
 class ConfidenceScoreEngine:
     """Calculate overall project confidence score."""
 
@@ -74,9 +252,38 @@ class ConfidenceScoreEngine:
         'revision_tracking': 0.02,
     }
 
+    # Array position of each component, in COMPONENT_WEIGHTS order
+    COMPONENT_INDEX = {name: i for i, name in enumerate(COMPONENT_WEIGHTS)}
+    WEIGHTS = np.array(list(COMPONENT_WEIGHTS.values()))
+    WEIGHTS.flags.writeable = False
+
+    # Components behind each category subscore
+    CATEGORY_COMPONENTS = {
+        'data_quality': ('drawing_ingestion', 'geometry_normalization'),
+        'design_confidence': (
+            'shear_wall_detection', 'load_path_analysis', 'rod_design'
+        ),
+        'verification_confidence': ('code_compliance', 'structural_audit'),
+        'completeness': ('clash_detection', 'revision_tracking'),
+    }
+    CATEGORY_MASKS = _category_masks(COMPONENT_WEIGHTS, CATEGORY_COMPONENTS)
+
     def __init__(self):
         self.component_scores: Dict[str, ComponentScore] = {}
-        self.project_factors: Optional[ProjectFactors] = None
+        self._project_factors: Optional[ProjectFactors] = None
+        self._factor_values = np.empty(0)
+
+        # Cached results, cleared whenever scores or factors change
+        self._adjustment: Optional[float] = None
+        self._overall_score: Optional[float] = None
+
+        # Scores as parallel arrays indexed by COMPONENT_INDEX; the
+        # ComponentScore objects keep the flags and details
+        n = len(self.COMPONENT_WEIGHTS)
+        self._raw = np.zeros(n)
+        self._penalty = np.ones(n)
+        self._scored = np.zeros(n, dtype=np.bool_)
+        self._order = np.empty(0, dtype=np.int64)  # indices in scoring order
 
     def add_component_score(
         self,
@@ -95,182 +302,190 @@ class ConfidenceScoreEngine:
             base_weight=self.COMPONENT_WEIGHTS[component_name],
             raw_score=raw_score,
             penalty_factor=penalty_factor,
-            flags=flags or [],
+            flags=flags or None,
             details=details
         )
 
+        i = self.COMPONENT_INDEX[component_name]
+        if not self._scored[i]:
+            self._order = np.append(self._order, i)
+        self._raw[i] = raw_score
+        self._penalty[i] = penalty_factor
+        self._scored[i] = True
+        self._invalidate()
+
+    @property
+    def project_factors(self) -> Optional[ProjectFactors]:
+        return self._project_factors
+
+    @project_factors.setter
+    def project_factors(self, factors: Optional[ProjectFactors]):
+        self._project_factors = factors
+        self._factor_values = (
+            np.array(astuple(factors), dtype=np.float64) if factors
+            else np.empty(0)
+        )
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drop cached scores after an input changes."""
+        self._adjustment = None
+        self._overall_score = None
+
     def set_project_factors(self, factors: ProjectFactors):
         """Set project-level adjustment factors."""
         self.project_factors = factors
 
     def _calculate_factor_adjustment(self) -> float:
         """Calculate adjustment multiplier from project factors."""
-        if not self.project_factors:
-            return 1.0
-
-        pf = self.project_factors
-
-        # Positive factors (boost score)
-        positive = (
-            0.10 * pf.drawing_clarity +
-            0.10 * pf.schedule_completeness +
-            0.15 * pf.load_path_continuity +
-            0.10 * pf.code_compliance_certainty
-        )
-
-        # Negative factors (reduce score)
-        conflict_penalty = min(0.20, pf.conflict_density * 0.05)
-        ambiguity_penalty = min(0.15, pf.ambiguity_count * 0.01)
-        assumption_penalty = min(0.15, pf.assumption_count * 0.01)
-        override_penalty = min(0.10, pf.manual_override_count * 0.02)
-
-        negative = (
-            conflict_penalty +
-            ambiguity_penalty +
-            assumption_penalty +
-            override_penalty
-        )
+        if self._adjustment is None:
+            self._adjustment = self._compute_factor_adjustment()
+        return self._adjustment
 
-        # Bounded adjustment factor
-        adjustment = 1.0 + positive - negative
-        return max(0.5, min(1.2, adjustment))
+    def _compute_factor_adjustment(self) -> float:
+        return float(_factor_adjustment_kernel(self._factor_values))
 
     def calculate_overall_score(self) -> float:
         """Calculate overall confidence score (0-100)."""
+        if self._overall_score is None:
+            self._overall_score = self._compute_overall_score()
+        return self._overall_score
+
+    def _compute_overall_score(self) -> float:
         if not self.component_scores:
             return 0.0
 
-        # Sum weighted contributions
-        raw_total = sum(
-            cs.weighted_contribution
-            for cs in self.component_scores.values()
-        )
+        normalized = self._weighted_mean(self._scored)
 
-        # Sum actual weights used
-        total_weight = sum(
-            cs.base_weight
-            for cs in self.component_scores.values()
-        )
+        # Apply project factors
+        adjusted_score = normalized * self._calculate_factor_adjustment()
+
+        # Bound to 0-100
+        return min(100, max(0, adjusted_score * 100))
 
-        # Normalize
-        normalized_score = raw_total / total_weight if total_weight > 0 else 0
+    def _weighted_mean(self, mask: np.ndarray) -> float:
+        """Weighted mean effective score over the masked components."""
+        return float(_weighted_mean_kernel(
+            self.WEIGHTS, self._raw, self._penalty, self._order, mask
+        ))
+
+    @classmethod
+    def score_batch(
+        cls,
+        raw: np.ndarray,
+        penalty: np.ndarray,
+        mask: np.ndarray,
+        factors: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Overall confidence scores (0-100) for N projects at once.
+
+        raw, penalty and mask are (N, K) arrays with columns in
+        COMPONENT_INDEX order; mask marks the scored components. factors
+        is an optional (N, 8) array with columns in ProjectFactors field
+        order; without it the factor adjustment is 1.0.
+
+        Each row is summed across its columns, not in the order the
+        scores were added, so row i can differ from
+        calculate_overall_score for the same inputs in the last bit.
+        """
+        raw = np.asarray(raw, dtype=np.float64)
+        penalty = np.asarray(penalty, dtype=np.float64)
+        w = cls.WEIGHTS * np.asarray(mask, dtype=np.bool_)
+
+        total_weight = w.sum(axis=1)
+        weighted_sum = (w * raw * penalty).sum(axis=1)
+        normalized = np.divide(
+            weighted_sum, total_weight,
+            out=np.zeros_like(weighted_sum), where=total_weight > 0
+        )
 
-        # Apply project factor adjustment
-        factor_adjustment = self._calculate_factor_adjustment()
-        adjusted_score = normalized_score * factor_adjustment
+        if factors is not None:
+            normalized = normalized * _factor_adjustment_batch(factors)
 
-        # Convert to 0-100 scale and bound
-        return min(100, max(0, adjusted_score * 100))
+        return np.clip(normalized * 100, 0, 100)
 
     def classify_risk(self, score: float) -> RiskClassification:
         """Classify risk level based on score."""
-        if score >= 85:
-            return RiskClassification.LOW
-        elif score >= 70:
-            return RiskClassification.MODERATE
-        elif score >= 50:
-            return RiskClassification.HIGH
-        else:
-            return RiskClassification.CRITICAL
+        return _RISK_BY_LEVEL[_risk_level(score)]
 
     def recommend_pe_review(self, score: float) -> Dict:
         """Generate PE review recommendation."""
-        risk = self.classify_risk(score)
-
-        intensity_map = {
-            RiskClassification.LOW: PEReviewIntensity.STANDARD,
-            RiskClassification.MODERATE: PEReviewIntensity.ENHANCED,
-            RiskClassification.HIGH: PEReviewIntensity.DETAILED,
-            RiskClassification.CRITICAL: PEReviewIntensity.FULL_RECALC,
-        }
-
-        scope_descriptions = {
-            PEReviewIntensity.STANDARD: (
-                "Spot-check critical connections, verify governing load case, "
-                "review representative calculations"
-            ),
-            PEReviewIntensity.ENHANCED: (
-                "Review all rod runs, verify load path continuity, "
-                "check anchorage design, validate shrinkage calculations"
-            ),
-            PEReviewIntensity.DETAILED: (
-                "Full calculation review, verify all assumptions, "
-                "field-verify drawing interpretations, check all code references"
-            ),
-            PEReviewIntensity.FULL_RECALC: (
-                "Independent recalculation recommended, significant uncertainty "
-                "identified, manual verification of all inputs required"
-            ),
-        }
-
-        time_estimates = {
-            PEReviewIntensity.STANDARD: "2-4 hours",
-            PEReviewIntensity.ENHANCED: "4-8 hours",
-            PEReviewIntensity.DETAILED: "1-2 days",
-            PEReviewIntensity.FULL_RECALC: "2-5 days",
-        }
-
-        intensity = intensity_map[risk]
+        level = _risk_level(score)
+        intensity, scope, time_estimate = _PE_TABLE[level]
 
         return {
             'confidence_score': round(score, 1),
-            'risk_classification': risk.value,
-            'review_intensity': intensity.value,
-            'estimated_scope': scope_descriptions[intensity],
-            'estimated_time': time_estimates[intensity],
+            'risk_classification': _RISK_NAMES[level],
+            'review_intensity': intensity,
+            'estimated_scope': scope,
+            'estimated_time': time_estimate,
         }
 
-    def _calculate_subscore(self, component_names: List[str]) -> float:
-        """Calculate subscore for a group of components."""
-        relevant = [
-            cs for cs in self.component_scores.values()
-            if cs.component_name in component_names
-        ]
+    def _calculate_subscore(self, category_mask: np.ndarray) -> float:
+        """Calculate subscore for a group of components (a CATEGORY_MASKS entry)."""
+        mask = category_mask & self._scored
 
-        if not relevant:
+        if not mask.any():
             return 0.0
 
-        total_weight = sum(cs.base_weight for cs in relevant)
-        weighted_sum = sum(cs.weighted_contribution for cs in relevant)
-
-        return (weighted_sum / total_weight * 100) if total_weight > 0 else 0
+        return self._weighted_mean(mask) * 100
+
+    def _component_details(self) -> Dict[str, Dict]:
+        """Per-component breakdown entries, rounded in one batch."""
+        raw_pct, effective_pct, contribution_pct = _round_array(np.stack((
+            self._raw,
+            self._raw * self._penalty,
+            self.WEIGHTS * self._raw * self._penalty,
+        )) * 100, 1).tolist()
+
+        details = {}
+        for name, cs in self.component_scores.items():
+            i = self.COMPONENT_INDEX[name]
+            details[name] = {
+                'raw_score': raw_pct[i],
+                'penalty_factor': cs.penalty_factor,
+                'effective_score': effective_pct[i],
+                'weight': cs.base_weight,
+                'contribution': contribution_pct[i],
+                'flags': cs.flags or [],
+            }
+        return details
 
     def generate_score_breakdown(self) -> Dict:
         """Generate detailed score breakdown."""
         overall = self.calculate_overall_score()
 
-        # Calculate category subscores
-        data_quality = self._calculate_subscore([
-            'drawing_ingestion', 'geometry_normalization'
-        ])
-        design_confidence = self._calculate_subscore([
-            'shear_wall_detection', 'load_path_analysis', 'rod_design'
-        ])
-        verification_confidence = self._calculate_subscore([
-            'code_compliance', 'structural_audit'
-        ])
-        completeness = self._calculate_subscore([
-            'clash_detection', 'revision_tracking'
-        ])
+        # Calculate category subscores, rounded in one batch
+        category_scores = dict(zip(self.CATEGORY_MASKS, _round_array(
+            [self._calculate_subscore(mask)
+             for mask in self.CATEGORY_MASKS.values()], 1
+        ).tolist()))
 
         # Identify positive and negative factors
+        # (components in the order they were scored)
+        scores = list(self.component_scores.values())
+        order = [self.COMPONENT_INDEX[cs.component_name] for cs in scores]
+        effective = self._raw[order] * self._penalty[order]
+
         positive_factors = []
-        negative_factors = []
+        for i in np.flatnonzero(effective >= 0.9).tolist():
+            cs = scores[i]
+            positive_factors.append({
+                'component': cs.component_name,
+                'score': cs.effective_score,
+                'details': cs.details or "High confidence"
+            })
 
-        for cs in self.component_scores.values():
-            if cs.effective_score >= 0.9:
-                positive_factors.append({
-                    'component': cs.component_name,
-                    'score': cs.effective_score,
-                    'details': cs.details or "High confidence"
-                })
-            elif cs.effective_score < 0.7:
-                negative_factors.append({
-                    'component': cs.component_name,
-                    'score': cs.effective_score,
-                    'flags': cs.flags,
-                    'details': cs.details or "Reduced confidence"
-                })
+        negative_factors = []
+        for i in np.flatnonzero(effective < 0.7).tolist():
+            cs = scores[i]
+            negative_factors.append({
+                'component': cs.component_name,
+                'score': cs.effective_score,
+                'flags': cs.flags or [],
+                'details': cs.details or "Reduced confidence"
+            })
 
         if self.project_factors:
             pf = self.project_factors
@@ -289,24 +504,9 @@ class ConfidenceScoreEngine:
 
         return {
             'overall_score': round(overall, 1),
-            'risk_classification': self.classify_risk(overall).value,
-            'category_scores': {
-                'data_quality': round(data_quality, 1),
-                'design_confidence': round(design_confidence, 1),
-                'verification_confidence': round(verification_confidence, 1),
-                'completeness': round(completeness, 1),
-            },
-            'component_details': {
-                name: {
-                    'raw_score': round(cs.raw_score * 100, 1),
-                    'penalty_factor': cs.penalty_factor,
-                    'effective_score': round(cs.effective_score * 100, 1),
-                    'weight': cs.base_weight,
-                    'contribution': round(cs.weighted_contribution * 100, 1),
-                    'flags': cs.flags,
-                }
-                for name, cs in self.component_scores.items()
-            },
+            'risk_classification': _RISK_NAMES[_risk_level(overall)],
+            'category_scores': category_scores,
+            'component_details': self._component_details(),
             'factor_adjustment': round(self._calculate_factor_adjustment(), 3),
             'positive_factors': positive_factors,
             'negative_factors': negative_factors,
@@ -314,61 +514,87 @@ class ConfidenceScoreEngine:
         }
 
 
-def print_score_breakdown(breakdown: Dict):
-    """Print formatted score breakdown."""
-    print("\n" + "=" * 70)
-    print("CONFIDENCE SCORE BREAKDOWN")
-    print("=" * 70)
+# Category score bars for bar lengths 0-50 (score / 2)
+_SCORE_BARS = tuple("#" * n + "-" * (50 - n) for n in range(51))
 
-    print(f"\nOverall Score: {breakdown['overall_score']}/100")
-    print(f"Risk Classification: {breakdown['risk_classification']}")
-    print(f"Factor Adjustment: {breakdown['factor_adjustment']}")
 
-    print("\n" + "-" * 70)
-    print("Category Scores:")
-    print("-" * 70)
+def _score_bar(bar_length: int) -> str:
+    """50-character score bar; out-of-range lengths are built directly."""
+    if 0 <= bar_length <= 50:
+        return _SCORE_BARS[bar_length]
+    return "#" * bar_length + "-" * (50 - bar_length)
+
+
+# Component table templates, parsed once
+_COMPONENT_HEADER = (
+    f"{'Component':<25}{'Raw':<8}{'Penalty':<10}{'Effective':<12}{'Weight'}\n"
+)
+_COMPONENT_ROW = (
+    "{0:<25}{raw_score:<8.1f}{penalty_factor:<10.2f}"
+    "{effective_score:<12.1f}{weight:.2f}\n"
+)
+_FLAG_ROW = "  └─ FLAG: {0}\n"
+
+
+def print_score_breakdown(breakdown: Dict, out: Optional[TextIO] = None):
+    """
+    Print formatted score breakdown.
+
+    The report is built in memory and written to out (default
+    sys.stdout) in a single call.
+    """
+    buf = io.StringIO()
+
+    print("\n" + "=" * 70, file=buf)
+    print("CONFIDENCE SCORE BREAKDOWN", file=buf)
+    print("=" * 70, file=buf)
+
+    print(f"\nOverall Score: {breakdown['overall_score']}/100", file=buf)
+    print(f"Risk Classification: {breakdown['risk_classification']}", file=buf)
+    print(f"Factor Adjustment: {breakdown['factor_adjustment']}", file=buf)
+
+    print("\n" + "-" * 70, file=buf)
+    print("Category Scores:", file=buf)
+    print("-" * 70, file=buf)
     for category, score in breakdown['category_scores'].items():
-        bar_length = int(score / 2)
-        bar = "#" * bar_length + "-" * (50 - bar_length)
-        print(f"  {category.replace('_', ' ').title():<25} [{bar}] {score:.1f}")
+        bar = _score_bar(int(score / 2))
+        print(f"  {category.replace('_', ' ').title():<25} [{bar}] {score:.1f}", file=buf)
 
-    print("\n" + "-" * 70)
-    print("Component Details:")
-    print("-" * 70)
-    print(f"{'Component':<25}{'Raw':<8}{'Penalty':<10}{'Effective':<12}{'Weight'}")
-    print("-" * 70)
+    print("\n" + "-" * 70, file=buf)
+    print("Component Details:", file=buf)
+    print("-" * 70, file=buf)
+    buf.write(_COMPONENT_HEADER)
+    print("-" * 70, file=buf)
 
     for name, details in breakdown['component_details'].items():
-        print(f"{name:<25}{details['raw_score']:<8.1f}"
-              f"{details['penalty_factor']:<10.2f}"
-              f"{details['effective_score']:<12.1f}"
-              f"{details['weight']:.2f}")
-        if details['flags']:
-            for flag in details['flags']:
-                print(f"  └─ FLAG: {flag}")
+        buf.write(_COMPONENT_ROW.format(name, **details))
+        for flag in details['flags']:
+            buf.write(_FLAG_ROW.format(flag))
 
     if breakdown['positive_factors']:
-        print("\n" + "-" * 70)
-        print("Positive Factors:")
-        print("-" * 70)
+        print("\n" + "-" * 70, file=buf)
+        print("Positive Factors:", file=buf)
+        print("-" * 70, file=buf)
         for factor in breakdown['positive_factors']:
-            print(f"  + {factor['component']}: {factor['details']}")
+            print(f"  + {factor['component']}: {factor['details']}", file=buf)
 
     if breakdown['negative_factors']:
-        print("\n" + "-" * 70)
-        print("Negative Factors:")
-        print("-" * 70)
+        print("\n" + "-" * 70, file=buf)
+        print("Negative Factors:", file=buf)
+        print("-" * 70, file=buf)
         for factor in breakdown['negative_factors']:
-            print(f"  - {factor['component']}: {factor['details']}")
+            print(f"  - {factor['component']}: {factor['details']}", file=buf)
 
-    print("\n" + "-" * 70)
-    print("PE Review Recommendation:")
-    print("-" * 70)
+    print("\n" + "-" * 70, file=buf)
+    print("PE Review Recommendation:", file=buf)
+    print("-" * 70, file=buf)
     pe = breakdown['pe_review']
-    print(f"  Review Intensity: {pe['review_intensity']}")
-    print(f"  Estimated Time: {pe['estimated_time']}")
-    print(f"  Scope: {pe['estimated_scope']}")
-    print()
+    print(f"  Review Intensity: {pe['review_intensity']}", file=buf)
+    print(f"  Estimated Time: {pe['estimated_time']}", file=buf)
+    print(f"  Scope: {pe['estimated_scope']}", file=buf)
+    print(file=buf)
+
+    (out or sys.stdout).write(buf.getvalue())
 
 
 # Example usage
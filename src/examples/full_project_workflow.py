@@ -5,12 +5,34 @@ Demonstrates the complete CTR design pipeline from drawing ingestion
 through report generation.
 """
 
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Deque, Optional
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import hashlib
+import operator
+from itertools import islice
+import os
+import sys
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as a script (python src/examples/<name>.py): resolve the
+    # relative imports below from the repository root (PEP 366)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))))
+    __package__ = "src.examples"
+
+from ..utils.jit import njit
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
 
 # Import from other examples (in practice these would be proper imports)
@@ -32,7 +54,17 @@ class LoadBasis(Enum):
     LRFD = "LRFD"
 
 
-@dataclass
+class DrawingStatus(str, Enum):
+    PENDING = "PENDING"
+    PARSED = "PARSED"
+
+
+class WallOrientation(str, Enum):
+    NS = "NS"
+    EW = "EW"
+
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration parameters."""
     name: str
@@ -47,7 +79,7 @@ class ProjectConfig:
     wood_species: str = "Douglas Fir-Larch"
 
 
-@dataclass
+@dataclass(slots=True)
 class Drawing:
     """Uploaded drawing metadata."""
     drawing_id: str
@@ -56,10 +88,10 @@ class Drawing:
     level: Optional[int]
     scale: Optional[float]
     upload_time: str
-    status: str = "PENDING"
+    status: DrawingStatus = DrawingStatus.PENDING
 
 
-@dataclass
+@dataclass(slots=True)
 class ShearWall:
     """Detected shear wall entity."""
     wall_id: str
@@ -70,10 +102,10 @@ class ShearWall:
     sheathing_type: str
     holdown_left: str
     holdown_right: str
-    orientation: str  # NS or EW
+    orientation: WallOrientation
 
 
-@dataclass
+@dataclass(slots=True)
 class RodRun:
     """Designed rod run entity."""
     rod_run_id: str
@@ -93,7 +125,7 @@ class RodRun:
     take_up_device: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Clash:
     """Detected clash entity."""
     clash_id: str
@@ -105,7 +137,7 @@ class Clash:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEvent:
     """Audit trail event."""
     event_id: str
@@ -116,21 +148,215 @@ class AuditEvent:
     data: Dict = field(default_factory=dict)
 
 
+# Rod sizes by max tension: below _TENSION_THRESHOLDS[i] (lb) uses
+# _ROD_DIAMETERS[i] (in); at or above the last threshold, the largest rod
+_TENSION_THRESHOLDS = (15000, 22000, 30000, 40000)
+_ROD_DIAMETERS = (0.625, 0.750, 0.875, 1.000, 1.125)
+
+# Simplified allowable tension for each rod size
+_ROD_CAPACITIES = tuple(
+    d ** 2 * 0.785 * 0.75 * 60000 / 2 for d in _ROD_DIAMETERS
+)
+
+_TENSION_THRESHOLD_ARR = np.array(_TENSION_THRESHOLDS, dtype=np.float64)
+_ROD_DIAMETER_ARR = np.array(_ROD_DIAMETERS)
+_ROD_CAPACITY_ARR = np.array(_ROD_CAPACITIES)
+for _arr in (_TENSION_THRESHOLD_ARR, _ROD_DIAMETER_ARR, _ROD_CAPACITY_ARR):
+    _arr.setflags(write=False)
+del _arr
+
+
+# Result arrays of _rod_design_kernel, in return order
+_ROD_DESIGN_KEYS = (
+    'max_tension', 'diameter', 'capacity', 'right_tension',
+    'left_utilization', 'right_utilization',
+    'left_elongation', 'right_elongation',
+)
+
+
+@njit(cache=True)
+def _rod_design_kernel(unit_shear, length, stories, thresholds, diameters,
+                       capacities):
+    """
+    Size the left and right rods of each grid from (grids, walls) wall
+    shear and length arrays, zero-padded past each grid's last wall.
+
+    Walls are accumulated in order, and each grid uses the first rod size
+    whose threshold exceeds its tension. The right rod carries 95% of
+    the left rod's tension.
+    """
+    n_grids, n_walls = unit_shear.shape
+    max_tension = np.zeros(n_grids)
+    diameter = np.empty(n_grids)
+    capacity = np.empty(n_grids)
+    right_tension = np.empty(n_grids)
+    left_utilization = np.empty(n_grids)
+    right_utilization = np.empty(n_grids)
+    left_elongation = np.empty(n_grids)
+    right_elongation = np.empty(n_grids)
+
+    for i in range(n_grids):
+        tension = 0.0
+        for j in range(n_walls):
+            tension += unit_shear[i, j] * length[i, j] * 0.8
+
+        size = 0
+        while size < thresholds.shape[0] and thresholds[size] <= tension:
+            size += 1
+
+        cap = capacities[size]
+        right = tension * 0.95
+        max_tension[i] = tension
+        diameter[i] = diameters[size]
+        capacity[i] = cap
+        right_tension[i] = right
+        left_utilization[i] = tension / cap
+        right_utilization[i] = right / cap
+        left_elongation[i] = tension * stories * 9.5 * 12 / (cap * 29e6) * 1000
+        right_elongation[i] = right * stories * 9.5 * 12 / (cap * 29e6) * 1000
+
+    return (max_tension, diameter, capacity, right_tension,
+            left_utilization, right_utilization,
+            left_elongation, right_elongation)
+
+
+def _rod_design_arrays(
+    unit_shear: np.ndarray,
+    length: np.ndarray,
+    stories: int
+) -> Dict[str, np.ndarray]:
+    """Rod design arrays for every grid, keyed by _ROD_DESIGN_KEYS."""
+    return dict(zip(_ROD_DESIGN_KEYS, _rod_design_kernel(
+        unit_shear, length, stories,
+        _TENSION_THRESHOLD_ARR, _ROD_DIAMETER_ARR, _ROD_CAPACITY_ARR
+    )))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 format with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat(
+        timespec='microseconds'
+    ).replace('+00:00', 'Z')
+
+
+# Sample NS grid lines and their wall lengths (ft), which grow 2 ft per
+# grid from 10 ft at grid A
+_SAMPLE_GRIDS = ('A', 'B', 'C', 'D')
+_SAMPLE_GRID_LENGTHS = tuple(
+    10.0 + (ord(g) - ord('A')) * 2 for g in _SAMPLE_GRIDS
+)
+
+# Pipeline component weights for the overall confidence score
+_SCORE_WEIGHTS = (
+    ('drawing_ingestion', 0.15),
+    ('geometry_normalization', 0.10),
+    ('shear_wall_detection', 0.20),
+    ('load_path_analysis', 0.15),
+    ('rod_design', 0.20),
+    ('clash_detection', 0.05),
+    ('code_compliance', 0.10),
+    ('structural_audit', 0.15),
+)
+_SCORE_TOTAL_WEIGHT = sum(weight for _, weight in _SCORE_WEIGHTS)
+
+# Risk classification and PE review by confidence score: scores below
+# _RISK_THRESHOLDS[i] fall in _RISK_TABLE[i], the rest in the last entry
+_RISK_THRESHOLDS = (50, 70, 85)
+_RISK_TABLE = (
+    ("CRITICAL", "Full Recalculation Recommended"),
+    ("HIGH", "Detailed PE Review"),
+    ("MODERATE", "Enhanced PE Review"),
+    ("LOW", "Standard PE Review"),
+)
+
+# Rod schedule keys and the RodRun attributes they are read from
+_ROD_SCHEDULE_FIELDS = (
+    ('rod_run_id', 'rod_run_id'),
+    ('grid_location', 'grid_location'),
+    ('position', 'position'),
+    ('direction', 'direction'),
+    ('diameter_in', 'rod_diameter_in'),
+    ('length_ft', 'total_length_ft'),
+    ('max_tension_lb', 'max_tension_lb'),
+    ('utilization', 'utilization_ratio'),
+    ('take_up_device', 'take_up_device'),
+)
+_ROD_SCHEDULE_KEYS = tuple(key for key, _ in _ROD_SCHEDULE_FIELDS)
+_rod_schedule_values = operator.attrgetter(
+    *(attr for _, attr in _ROD_SCHEDULE_FIELDS)
+)
+
+
+# Fixed sections of the summary report; the header is filled in with
+# str.format and the rows between sections are joined in
+_RULE = "-" * 70
+
+_SUMMARY_HEADER = "\n".join([
+    "=" * 70,
+    "CTR DESIGN SUMMARY REPORT",
+    "=" * 70,
+    "",
+    "Project: {config.name}",
+    "Address: {config.address}",
+    "Project ID: {project_id}",
+    "Generated: {generated}",
+    "",
+    _RULE,
+    "BUILDING PARAMETERS",
+    _RULE,
+    "Stories: {config.stories}",
+    "Construction Type: {config.construction_type}",
+    "Seismic Design Category: {config.seismic_design_category}",
+    "SDS: {config.sds}g",
+    "SD1: {config.sd1}g",
+    "Load Basis: {config.load_basis.value}",
+    "",
+    _RULE,
+    "DESIGN SUMMARY",
+    _RULE,
+    "Shear Walls Detected: {wall_count}",
+    "Rod Runs Designed: {rod_count}",
+    "Clashes Detected: {clash_count}",
+    "Confidence Score: {confidence_score:.1f}/100",
+    "",
+    _RULE,
+    "ROD SCHEDULE",
+    _RULE,
+    f"{'Rod Run':<12}{'Grid':<8}{'Dia.':<8}{'Length':<10}{'Max T':<12}{'Util.':<8}",
+    _RULE,
+])
+
+# Rod schedule row of the summary report and the RodRun fields it shows
+_format_rod_row = '{:<12}{:<8}{}"    {:<10.1f}{:<12,.0f}{:<8.2f}'.format
+_rod_row_values = operator.attrgetter(
+    'rod_run_id', 'grid_location', 'rod_diameter_in',
+    'total_length_ft', 'max_tension_lb', 'utilization_ratio',
+)
+
+_MATERIAL_HEADER = "\n".join(["", _RULE, "MATERIAL SUMMARY", _RULE])
+_CLASH_HEADER = "\n".join(["", _RULE, "CLASH SUMMARY", _RULE])
+_SCORE_HEADER = "\n".join(["", _RULE, "CONFIDENCE SCORE BREAKDOWN", _RULE])
+
+
 class CTRProject:
     """Main project orchestrator for CTR design."""
 
+    # Most recent audit events kept in memory
+    AUDIT_TRAIL_MAXLEN = 10_000
+
     def __init__(self, config: ProjectConfig):
         self.config = config
         self.project_id = self._generate_id()
         self.status = ProjectStatus.CREATED
-        self.created_at = datetime.utcnow().isoformat() + "Z"
+        self.created_at = _utc_timestamp()
 
         # Data stores
         self.drawings: List[Drawing] = []
         self.shear_walls: List[ShearWall] = []
         self.rod_runs: List[RodRun] = []
         self.clashes: List[Clash] = []
-        self.audit_trail: List[AuditEvent] = []
+        self.audit_trail: Deque[AuditEvent] = deque(maxlen=self.AUDIT_TRAIL_MAXLEN)
+        self._event_count = 0  # events logged, including any no longer retained
 
         # Scores
         self.component_scores: Dict[str, float] = {}
@@ -140,14 +366,16 @@ class CTRProject:
 
     def _generate_id(self) -> str:
         """Generate unique project ID."""
-        hash_input = f"{self.config.name}{datetime.utcnow().isoformat()}"
-        return f"proj-{hashlib.md5(hash_input.encode()).hexdigest()[:12]}"
+        hash_input = f"{self.config.name}{_utc_timestamp()}"
+        digest = hashlib.blake2b(hash_input.encode(), digest_size=6)
+        return f"proj-{digest.hexdigest()}"
 
     def _log_event(self, event_type: str, actor: str, description: str, data: Dict = None):
         """Log an audit event."""
+        self._event_count += 1
         event = AuditEvent(
-            event_id=f"EVT-{len(self.audit_trail)+1:05d}",
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            event_id=f"EVT-{self._event_count:05d}",
+            timestamp=_utc_timestamp(),
             event_type=event_type,
             actor=actor,
             description=description,
@@ -163,7 +391,7 @@ class CTRProject:
             drawing_type=drawing_type,
             level=level,
             scale=None,
-            upload_time=datetime.utcnow().isoformat() + "Z"
+            upload_time=_utc_timestamp()
         )
         self.drawings.append(drawing)
         self.status = ProjectStatus.DRAWINGS_UPLOADED
@@ -196,7 +424,7 @@ class CTRProject:
         print("\n[1/8] Drawing Ingestion Agent...")
         for drawing in self.drawings:
             drawing.scale = 0.25  # 1/4" = 1'-0"
-            drawing.status = "PARSED"
+            drawing.status = DrawingStatus.PARSED
             results['drawings_processed'] += 1
         self.component_scores['drawing_ingestion'] = 0.92
         self._log_event("DRAWINGS_PARSED", "System", f"Parsed {len(self.drawings)} drawings")
@@ -275,16 +503,25 @@ class CTRProject:
     def _detect_shear_walls(self):
         """Simulate shear wall detection."""
         # Sample walls for a 5-story building
-        grids = ['A', 'B', 'C', 'D']
-        levels = range(1, self.config.stories + 1)
+        grids = _SAMPLE_GRIDS
+        lengths = _SAMPLE_GRID_LENGTHS
 
-        wall_count = 0
-        for grid in grids:
-            for level in levels:
-                # Varying unit shears by level (higher at bottom)
-                base_shear = 300 + (self.config.stories - level) * 60
-                length = 10.0 + (ord(grid) - ord('A')) * 2
+        # Story levels (1 = bottom) and stories above each, from the
+        # current config so walls agree with the rod runs designed later
+        stories = self.config.stories
+        levels_arr = np.arange(1, stories + 1)
+        levels_desc = stories - levels_arr
 
+        # Varying unit shears by level (higher at bottom)
+        ns_shear = (300 + levels_desc * 60).tolist()
+        ew_shear = (280 + levels_desc * 50).tolist()
+        levels = levels_arr.tolist()
+
+        # One shared holdown string per level for every wall on it
+        holdowns = [sys.intern(f"HDU{8 + level}") for level in levels]
+
+        for grid, length in zip(grids, lengths):
+            for level, base_shear, holdown in zip(levels, ns_shear, holdowns):
                 wall = ShearWall(
                     wall_id=f"SW-{grid}-L{level}",
                     level=level,
@@ -292,73 +529,69 @@ class CTRProject:
                     length_ft=length,
                     unit_shear_plf=base_shear,
                     sheathing_type="15/32 OSB",
-                    holdown_left=f"HDU{8 + level}",
-                    holdown_right=f"HDU{8 + level}",
-                    orientation="NS"
+                    holdown_left=holdown,
+                    holdown_right=holdown,
+                    orientation=WallOrientation.NS
                 )
                 self.shear_walls.append(wall)
-                wall_count += 1
 
         # Add some EW walls
-        for level in levels:
+        for level, base_shear in zip(levels, ew_shear):
             wall = ShearWall(
                 wall_id=f"SW-1-L{level}",
                 level=level,
                 grid_location="1",
                 length_ft=14.0,
-                unit_shear_plf=280 + (self.config.stories - level) * 50,
+                unit_shear_plf=base_shear,
                 sheathing_type="15/32 OSB",
                 holdown_left="HDU8",
                 holdown_right="HDU8",
-                orientation="EW"
+                orientation=WallOrientation.EW
             )
             self.shear_walls.append(wall)
 
     def _design_rod_runs(self):
         """Simulate rod run design."""
         # Group walls by grid for rod runs
-        grids = set(w.grid_location for w in self.shear_walls if w.orientation == "NS")
-
-        for grid in sorted(grids):
-            grid_walls = [w for w in self.shear_walls
-                         if w.grid_location == grid and w.orientation == "NS"]
-
-            if not grid_walls:
-                continue
-
-            # Calculate cumulative tension (simplified)
-            max_tension = sum(w.unit_shear_plf * w.length_ft * 0.8 for w in grid_walls)
-
-            # Select rod size
-            if max_tension < 15000:
-                diameter = 0.625
-            elif max_tension < 22000:
-                diameter = 0.750
-            elif max_tension < 30000:
-                diameter = 0.875
-            elif max_tension < 40000:
-                diameter = 1.000
-            else:
-                diameter = 1.125
-
-            # Calculate capacity
-            capacity = diameter ** 2 * 0.785 * 0.75 * 60000 / 2  # Simplified
-
+        walls_by_grid = defaultdict(list)
+        for w in self.shear_walls:
+            if w.orientation == WallOrientation.NS:
+                walls_by_grid[w.grid_location].append(w)
+        if not walls_by_grid:
+            return
+
+        grids = sorted(walls_by_grid)
+        grid_walls = [walls_by_grid[grid] for grid in grids]
+
+        # Wall shear and length as (grids, walls) arrays, zero-padded
+        shape = (len(grid_walls), max(len(walls) for walls in grid_walls))
+        unit_shear = np.zeros(shape)
+        length = np.zeros(shape)
+        for i, walls in enumerate(grid_walls):
+            unit_shear[i, :len(walls)] = [w.unit_shear_plf for w in walls]
+            length[i, :len(walls)] = [w.length_ft for w in walls]
+
+        # Calculate cumulative tension (simplified), then size every rod
+        stories = self.config.stories
+        design = _rod_design_arrays(unit_shear, length, stories)
+        design = {key: values.tolist() for key, values in design.items()}
+
+        for i, grid in enumerate(grids):
             rod = RodRun(
                 rod_run_id=f"RR-{grid}-01",
                 grid_location=grid,
                 position="LEFT",
                 direction="NS",
                 start_level=1,
-                end_level=self.config.stories,
-                rod_diameter_in=diameter,
+                end_level=stories,
+                rod_diameter_in=design['diameter'][i],
                 rod_grade="A307",
-                total_length_ft=self.config.stories * 9.5,
-                max_tension_lb=max_tension,
-                allowable_tension_lb=capacity,
-                utilization_ratio=max_tension / capacity,
-                shrinkage_in=self.config.stories * 0.08,
-                elongation_in=max_tension * self.config.stories * 9.5 * 12 / (capacity * 29e6) * 1000,
+                total_length_ft=stories * 9.5,
+                max_tension_lb=design['max_tension'][i],
+                allowable_tension_lb=design['capacity'][i],
+                utilization_ratio=design['left_utilization'][i],
+                shrinkage_in=stories * 0.08,
+                elongation_in=design['left_elongation'][i],
                 take_up_device="RTUD4"
             )
             self.rod_runs.append(rod)
@@ -370,15 +603,15 @@ class CTRProject:
                 position="RIGHT",
                 direction="NS",
                 start_level=1,
-                end_level=self.config.stories,
-                rod_diameter_in=diameter,
+                end_level=stories,
+                rod_diameter_in=design['diameter'][i],
                 rod_grade="A307",
-                total_length_ft=self.config.stories * 9.5,
-                max_tension_lb=max_tension * 0.95,
-                allowable_tension_lb=capacity,
-                utilization_ratio=(max_tension * 0.95) / capacity,
-                shrinkage_in=self.config.stories * 0.08,
-                elongation_in=max_tension * 0.95 * self.config.stories * 9.5 * 12 / (capacity * 29e6) * 1000,
+                total_length_ft=stories * 9.5,
+                max_tension_lb=design['right_tension'][i],
+                allowable_tension_lb=design['capacity'][i],
+                utilization_ratio=design['right_utilization'][i],
+                shrinkage_in=stories * 0.08,
+                elongation_in=design['right_elongation'][i],
                 take_up_device="RTUD4"
             )
             self.rod_runs.append(rod_right)
@@ -407,145 +640,69 @@ class CTRProject:
 
     def _calculate_confidence_score(self):
         """Calculate overall confidence score."""
-        weights = {
-            'drawing_ingestion': 0.15,
-            'geometry_normalization': 0.10,
-            'shear_wall_detection': 0.20,
-            'load_path_analysis': 0.15,
-            'rod_design': 0.20,
-            'clash_detection': 0.05,
-            'code_compliance': 0.10,
-            'structural_audit': 0.15,
-        }
+        scores = self.component_scores
+        weighted_sum = 0
+        for comp, weight in _SCORE_WEIGHTS:
+            weighted_sum += scores.get(comp, 0) * weight
 
-        total_weight = sum(weights.values())
-        weighted_sum = sum(
-            self.component_scores.get(comp, 0) * weight
-            for comp, weight in weights.items()
-        )
-
-        self.confidence_score = (weighted_sum / total_weight) * 100
+        self.confidence_score = (weighted_sum / _SCORE_TOTAL_WEIGHT) * 100
 
     def get_rod_schedule(self) -> List[Dict]:
         """Get rod schedule as list of dictionaries."""
         return [
-            {
-                'rod_run_id': r.rod_run_id,
-                'grid_location': r.grid_location,
-                'position': r.position,
-                'direction': r.direction,
-                'diameter_in': r.rod_diameter_in,
-                'length_ft': r.total_length_ft,
-                'max_tension_lb': r.max_tension_lb,
-                'utilization': r.utilization_ratio,
-                'take_up_device': r.take_up_device,
-            }
+            dict(zip(_ROD_SCHEDULE_KEYS, _rod_schedule_values(r)))
             for r in self.rod_runs
         ]
 
     def generate_summary_report(self) -> str:
         """Generate text summary report."""
-        lines = [
-            "=" * 70,
-            "CTR DESIGN SUMMARY REPORT",
-            "=" * 70,
-            "",
-            f"Project: {self.config.name}",
-            f"Address: {self.config.address}",
-            f"Project ID: {self.project_id}",
-            f"Generated: {datetime.utcnow().isoformat()}Z",
-            "",
-            "-" * 70,
-            "BUILDING PARAMETERS",
-            "-" * 70,
-            f"Stories: {self.config.stories}",
-            f"Construction Type: {self.config.construction_type}",
-            f"Seismic Design Category: {self.config.seismic_design_category}",
-            f"SDS: {self.config.sds}g",
-            f"SD1: {self.config.sd1}g",
-            f"Load Basis: {self.config.load_basis.value}",
-            "",
-            "-" * 70,
-            "DESIGN SUMMARY",
-            "-" * 70,
-            f"Shear Walls Detected: {len(self.shear_walls)}",
-            f"Rod Runs Designed: {len(self.rod_runs)}",
-            f"Clashes Detected: {len(self.clashes)}",
-            f"Confidence Score: {self.confidence_score:.1f}/100",
-            "",
-            "-" * 70,
-            "ROD SCHEDULE",
-            "-" * 70,
-            f"{'Rod Run':<12}{'Grid':<8}{'Dia.':<8}{'Length':<10}{'Max T':<12}{'Util.':<8}",
-            "-" * 70,
-        ]
-
-        for rod in self.rod_runs:
-            lines.append(
-                f"{rod.rod_run_id:<12}{rod.grid_location:<8}"
-                f"{rod.rod_diameter_in}\"{'':4}{rod.total_length_ft:<10.1f}"
-                f"{rod.max_tension_lb:<12,.0f}{rod.utilization_ratio:<8.2f}"
-            )
-
-        lines.extend([
-            "",
-            "-" * 70,
-            "MATERIAL SUMMARY",
-            "-" * 70,
-        ])
-
-        # Calculate totals by diameter
-        by_diameter = {}
+        lines = [_SUMMARY_HEADER.format(
+            config=self.config,
+            project_id=self.project_id,
+            generated=_utc_timestamp(),
+            wall_count=len(self.shear_walls),
+            rod_count=len(self.rod_runs),
+            clash_count=len(self.clashes),
+            confidence_score=self.confidence_score,
+        )]
+
+        # Schedule rows, plus totals by diameter, in one pass over the rods
+        diameter_counts = Counter()
+        diameter_lengths = defaultdict(float)
+        total_length = 0
         for rod in self.rod_runs:
+            lines.append(_format_rod_row(*_rod_row_values(rod)))
             d = rod.rod_diameter_in
-            if d not in by_diameter:
-                by_diameter[d] = {'count': 0, 'length': 0}
-            by_diameter[d]['count'] += 1
-            by_diameter[d]['length'] += rod.total_length_ft
-
-        for d in sorted(by_diameter.keys()):
-            info = by_diameter[d]
-            lines.append(f"{d}\" Rod: {info['count']} runs, {info['length']:.1f} ft total")
-
-        total_length = sum(r.total_length_ft for r in self.rod_runs)
+            diameter_counts[d] += 1
+            diameter_lengths[d] += rod.total_length_ft
+            total_length += rod.total_length_ft
+
+        lines.append(_MATERIAL_HEADER)
+        lines.extend(
+            f"{d}\" Rod: {diameter_counts[d]} runs, "
+            f"{diameter_lengths[d]:.1f} ft total"
+            for d in sorted(diameter_counts)
+        )
         lines.append(f"\nTotal Rod Length: {total_length:.1f} ft")
 
         if self.clashes:
-            lines.extend([
-                "",
-                "-" * 70,
-                "CLASH SUMMARY",
-                "-" * 70,
-            ])
+            lines.append(_CLASH_HEADER)
             for clash in self.clashes:
                 lines.append(f"[{clash.severity}] {clash.rod_run_id} vs {clash.element_type}")
                 lines.append(f"  Level {clash.level}: {clash.description}")
 
-        lines.extend([
-            "",
-            "-" * 70,
-            "CONFIDENCE SCORE BREAKDOWN",
-            "-" * 70,
-        ])
-
-        for comp, score in sorted(self.component_scores.items()):
-            lines.append(f"{comp.replace('_', ' ').title():<30} {score*100:.1f}")
+        lines.append(_SCORE_HEADER)
+        lines.extend(
+            f"{comp.replace('_', ' ').title():<30} {score*100:.1f}"
+            for comp, score in sorted(self.component_scores.items())
+        )
 
         lines.append(f"\n{'OVERALL SCORE:':<30} {self.confidence_score:.1f}/100")
 
         # Risk classification
-        if self.confidence_score >= 85:
-            risk = "LOW"
-            review = "Standard PE Review"
-        elif self.confidence_score >= 70:
-            risk = "MODERATE"
-            review = "Enhanced PE Review"
-        elif self.confidence_score >= 50:
-            risk = "HIGH"
-            review = "Detailed PE Review"
-        else:
-            risk = "CRITICAL"
-            review = "Full Recalculation Recommended"
+        risk, review = _RISK_TABLE[
+            bisect_right(_RISK_THRESHOLDS, self.confidence_score)
+        ]
 
         lines.extend([
             f"Risk Classification: {risk}",
@@ -592,8 +749,10 @@ class CTRProject:
                 }
                 for c in self.clashes
             ],
-            'audit_trail_count': len(self.audit_trail),
+            'audit_trail_count': self._event_count,
         }
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(data, indent=2)
 
 
@@ -667,7 +826,8 @@ if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("AUDIT TRAIL (Last 10 Events)")
     print("=" * 70)
-    for event in project.audit_trail[-10:]:
+    trail = project.audit_trail
+    for event in islice(trail, max(0, len(trail) - 10), None):
         print(f"[{event.timestamp}] {event.event_type}: {event.description}")
 
     print("\n>>> Workflow complete!")
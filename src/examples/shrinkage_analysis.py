@@ -6,9 +6,25 @@ for take-up device specification.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, TextIO, Tuple
 from enum import Enum
+from array import array
+import functools
+import io
 import math
+import os
+import sys
+
+import numpy as np
+
+if __package__ in (None, ""):
+    # Run as a script (python src/examples/<name>.py): resolve the
+    # relative imports below from the repository root (PEP 366)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))))
+    __package__ = "src.examples"
+
+from ..utils.jit import njit, prange
 
 
 class WoodSpecies(Enum):
@@ -17,13 +33,17 @@ class WoodSpecies(Enum):
     SPRUCE_PINE_FIR = "Spruce-Pine-Fir"
     HEM_FIR = "Hem-Fir"
 
+    def __init__(self, label: str):
+        # Position in definition order, for the coefficient tables
+        self.index = len(type(self).__members__)
+
 
 class GrainDirection(Enum):
     PERPENDICULAR = "perpendicular"  # Tangential/radial shrinkage
     PARALLEL = "parallel"  # Longitudinal (negligible)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WoodShrinkageProperties:
     """Shrinkage coefficients by species."""
     species: WoodSpecies
@@ -46,8 +66,29 @@ SHRINKAGE_COEFFICIENTS = {
     ),
 }
 
-
-@dataclass
+# (tangential, radial) coefficients and their arrays, by WoodSpecies.index
+_SPECIES_COEFFS = tuple(
+    (SHRINKAGE_COEFFICIENTS[sp].tangential_coeff,
+     SHRINKAGE_COEFFICIENTS[sp].radial_coeff)
+    for sp in WoodSpecies
+)
+_TANGENTIAL_ARR, _RADIAL_ARR = np.array(_SPECIES_COEFFS).T.copy()
+_TANGENTIAL_ARR.setflags(write=False)
+_RADIAL_ARR.setflags(write=False)
+
+# Moisture content (%): S-Green lumber at installation and in service.
+# Wood only shrinks below the fiber saturation point.
+INITIAL_MC = 19.0
+FINAL_MC = 12.0
+FIBER_SATURATION_MC = 30.0
+
+# Moisture content change at the defaults above
+_DEFAULT_DELTA_MC = (
+    min(INITIAL_MC, FIBER_SATURATION_MC) - min(FINAL_MC, FIBER_SATURATION_MC)
+)
+
+
+@dataclass(slots=True, frozen=True)
 class FloorAssembly:
     """Definition of a floor assembly for shrinkage calculation."""
     level: int
@@ -58,7 +99,7 @@ class FloorAssembly:
     species: WoodSpecies
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TakeUpDevice:
     """Take-up device specifications."""
     model: str
@@ -78,12 +119,79 @@ TAKE_UP_DEVICES = [
     TakeUpDevice("ATUD14", "Simpson", 3.00, 23110),
 ]
 
+# TAKE_UP_DEVICES as columns (travel, load, model), for batch selection
+_DEVICES_ARR = np.array(
+    [(d.travel_capacity_in, d.allowable_load_lb, d.model)
+     for d in TAKE_UP_DEVICES],
+    dtype=[('travel', 'f8'), ('load', 'f8'), ('model', 'U8')]
+)
+_DEVICES_ARR.setflags(write=False)
+
+
+# Thread counts per inch (UNC) for standard rod diameters
+THREADS_PER_INCH = {
+    0.625: 11, 0.750: 10, 0.875: 9, 1.000: 8,
+    1.125: 7, 1.250: 7, 1.375: 6, 1.500: 6,
+}
+
+
+_PI_4 = math.pi / 4
+
+
+def _tensile_stress_area(diameter_in: float, threads_per_inch: float) -> float:
+    """A_s = (π/4) × (d - 0.9743/n)²"""
+    d_eff = diameter_in - 0.9743 / threads_per_inch
+    return _PI_4 * (d_eff * d_eff)
+
+
+# Tensile stress area (in²) of each standard diameter
+_TENSILE_STRESS_AREA = {
+    d: _tensile_stress_area(d, n) for d, n in THREADS_PER_INCH.items()
+}
+
+
+@njit(cache=True)
+def _shrinkage_kernel(thickness_in, tangential_coeff, radial_coeff,
+                      initial_mc, final_mc):
+    """Perpendicular-to-grain shrinkage (in) from scalar inputs."""
+    # Use average of tangential and radial (conservative)
+    avg_coeff = (tangential_coeff + radial_coeff) / 2
+
+    # Calculate MC change (only below fiber saturation point)
+    delta_mc = (
+        min(initial_mc, FIBER_SATURATION_MC) - min(final_mc, FIBER_SATURATION_MC)
+    )
+
+    # Calculate shrinkage; select rather than branch so the clamp
+    # lowers to maxsd (NaN clamps to 0.0, as with max(0.0, x))
+    shrinkage = thickness_in * avg_coeff * delta_mc
+    return shrinkage if shrinkage > 0.0 else 0.0
+
+
+@njit(cache=True)
+def _elongation_kernel(tension_lb, length_in, stress_area, elastic_modulus_psi):
+    """Rod elongation (in) for a known tensile stress area."""
+    return (tension_lb * length_in) / (stress_area * elastic_modulus_psi)
+
+
+# Prefer the ahead-of-time build of the scalar kernels when it is present
+# (python -m src.examples._compiled); otherwise use the JIT versions above.
+try:
+    from .ctr_shrinkage import (
+        shrinkage as _shrinkage_impl,
+        rod_elongation as _elongation_impl,
+    )
+except ImportError:
+    _shrinkage_impl = _shrinkage_kernel
+    _elongation_impl = _elongation_kernel
+
 
+@functools.lru_cache(maxsize=256)
 def compute_wood_shrinkage(
     thickness_in: float,
     species: WoodSpecies,
-    initial_mc: float = 19.0,
-    final_mc: float = 12.0,
+    initial_mc: float = INITIAL_MC,
+    final_mc: float = FINAL_MC,
     grain_direction: GrainDirection = GrainDirection.PERPENDICULAR
 ) -> float:
     """
@@ -98,24 +206,18 @@ def compute_wood_shrinkage(
 
     Per NDS, shrinkage only occurs below fiber saturation point (~30% MC).
     For S-Green lumber, initial MC is typically 19%.
+
+    Plate and joist depths repeat across floors and designs, so results
+    are memoized.
     """
-    props = SHRINKAGE_COEFFICIENTS[species]
+    tangential_coeff, radial_coeff = _SPECIES_COEFFS[species.index]
 
     if grain_direction == GrainDirection.PARALLEL:
         return 0.0  # Longitudinal shrinkage is negligible
 
-    # Use average of tangential and radial (conservative)
-    avg_coeff = (props.tangential_coeff + props.radial_coeff) / 2
-
-    # Calculate MC change (only below fiber saturation point)
-    effective_initial = min(initial_mc, 30.0)
-    effective_final = min(final_mc, 30.0)
-    delta_mc = effective_initial - effective_final
-
-    # Calculate shrinkage
-    shrinkage = thickness_in * avg_coeff * delta_mc
-
-    return max(0, shrinkage)
+    return float(_shrinkage_impl(
+        thickness_in, tangential_coeff, radial_coeff, initial_mc, final_mc
+    ))
 
 
 def compute_rod_elongation(
@@ -136,18 +238,14 @@ def compute_rod_elongation(
     - E = elastic modulus
     """
     # Calculate tensile stress area
-    threads_per_inch = {
-        0.625: 11, 0.750: 10, 0.875: 9, 1.000: 8,
-        1.125: 7, 1.250: 7, 1.375: 6, 1.500: 6,
-    }
-    n = threads_per_inch.get(diameter_in, 8 / diameter_in)
-    d_eff = diameter_in - 0.9743 / n
-    a_s = (math.pi / 4) * d_eff ** 2
+    a_s = _TENSILE_STRESS_AREA.get(diameter_in)
+    if a_s is None:
+        a_s = _tensile_stress_area(diameter_in, 8 / diameter_in)
 
     # Calculate elongation
-    elongation = (tension_lb * length_in) / (a_s * elastic_modulus_psi)
-
-    return elongation
+    return float(_elongation_impl(
+        tension_lb, length_in, a_s, elastic_modulus_psi
+    ))
 
 
 def analyze_floor_shrinkage(assembly: FloorAssembly) -> Dict[str, float]:
@@ -190,10 +288,61 @@ def analyze_floor_shrinkage(assembly: FloorAssembly) -> Dict[str, float]:
     }
 
 
-@dataclass
+def _floor_shrinkage_arrays(
+    floor_assemblies: List[FloorAssembly]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Top plate, bottom plate and joist shrinkage of every floor.
+
+    Vectorized form of analyze_floor_shrinkage over the assemblies, at
+    the default INITIAL_MC to FINAL_MC moisture content change.
+    """
+    species_idx = np.array(
+        [a.species.index for a in floor_assemblies], dtype=np.intp
+    )
+    avg_coeff = (_TANGENTIAL_ARR[species_idx] + _RADIAL_ARR[species_idx]) / 2
+    delta_mc = _DEFAULT_DELTA_MC
+
+    depths = np.array(
+        [(a.top_plate_depth_in, a.bottom_plate_depth_in, a.joist_depth_in)
+         for a in floor_assemblies],
+        dtype=np.float64
+    ).reshape(-1, 3).T
+    # fmax rather than maximum: NaN clamps to 0.0 as in the scalar kernel
+    top_plate, bottom_plate, joist = np.fmax(
+        depths * avg_coeff * delta_mc, 0.0
+    )
+    return top_plate, bottom_plate, joist
+
+
+class FloorDetails:
+    """
+    Per-floor shrinkage components (in), in floor assembly order.
+
+    Each field is a flat array with one entry per floor: levels holds
+    the integer level numbers, the rest hold doubles.
+    """
+    __slots__ = ('levels', 'top', 'bot', 'joist', 'total')
+
+    def __init__(self):
+        self.levels = array('q')
+        self.top = array('d')
+        self.bot = array('d')
+        self.joist = array('d')
+        self.total = array('d')
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def rows(self):
+        """(level, top plate, bottom plate, joist, total) of each floor."""
+        return zip(self.levels, self.top, self.bot, self.joist, self.total)
+
+
+@dataclass(slots=True, frozen=True)
 class ShrinkageAnalysisResult:
     """Complete shrinkage analysis results."""
-    floor_details: List[Dict[str, float]]
+    floor_details: FloorDetails
     total_shrinkage_in: float
     rod_elongation_in: float
     net_movement_in: float
@@ -202,12 +351,44 @@ class ShrinkageAnalysisResult:
     placement_level: int
 
 
+def _select_take_up_device(required_travel_in: float, max_tension_lb: float) -> TakeUpDevice:
+    """First listed device with enough travel and load capacity."""
+    for device in TAKE_UP_DEVICES:
+        if device.travel_capacity_in >= required_travel_in:
+            if device.allowable_load_lb >= max_tension_lb:
+                return device
+
+    # Fall back to largest device
+    return TAKE_UP_DEVICES[-1]
+
+
+def _select_take_up_devices(required_travel_in, max_tension_lb) -> np.ndarray:
+    """
+    TAKE_UP_DEVICES index chosen by _select_take_up_device for each
+    (required travel, tension) pair; arrays broadcast together.
+    """
+    required = np.atleast_1d(np.asarray(required_travel_in, dtype=np.float64))
+    tension = np.broadcast_to(
+        np.asarray(max_tension_lb, dtype=np.float64), required.shape
+    )
+    viable = (
+        (_DEVICES_ARR['travel'] >= required[..., None]) &
+        (_DEVICES_ARR['load'] >= tension[..., None])
+    )
+
+    # First viable device in catalog order; fall back to the largest
+    return np.where(
+        viable.any(axis=-1), viable.argmax(axis=-1), len(TAKE_UP_DEVICES) - 1
+    )
+
+
 def analyze_rod_run_shrinkage(
     floor_assemblies: List[FloorAssembly],
     rod_diameter_in: float,
     rod_length_ft: float,
     max_tension_lb: float,
-    safety_factor: float = 1.25
+    safety_factor: float = 1.25,
+    collect_details: bool = True
 ) -> ShrinkageAnalysisResult:
     """
     Complete shrinkage analysis for a rod run.
@@ -218,12 +399,24 @@ def analyze_rod_run_shrinkage(
     3. Net movement (shrinkage - elongation)
     4. Required take-up device travel
     5. Recommended device and placement
+
+    With collect_details=False only the totals are computed and
+    floor_details is left empty, for batch runs that never report it.
     """
-    # Analyze each floor
-    floor_details = [analyze_floor_shrinkage(assembly) for assembly in floor_assemblies]
+    # Analyze every floor at once
+    top_plate, bottom_plate, joist = _floor_shrinkage_arrays(floor_assemblies)
+    totals = (top_plate + bottom_plate + joist).tolist()
+
+    floor_details = FloorDetails()
+    if collect_details:
+        floor_details.levels.extend([a.level for a in floor_assemblies])
+        floor_details.top.frombytes(top_plate.tobytes())
+        floor_details.bot.frombytes(bottom_plate.tobytes())
+        floor_details.joist.frombytes(joist.tobytes())
+        floor_details.total.fromlist(totals)
 
     # Sum total shrinkage
-    total_shrinkage = sum(fd['total_in'] for fd in floor_details)
+    total_shrinkage = sum(totals)
 
     # Calculate rod elongation
     rod_length_in = rod_length_ft * 12
@@ -240,16 +433,7 @@ def analyze_rod_run_shrinkage(
     required_travel = max(0, net_movement * safety_factor)
 
     # Select take-up device
-    recommended_device = None
-    for device in TAKE_UP_DEVICES:
-        if device.travel_capacity_in >= required_travel:
-            if device.allowable_load_lb >= max_tension_lb:
-                recommended_device = device
-                break
-
-    if recommended_device is None:
-        # Fall back to largest device
-        recommended_device = TAKE_UP_DEVICES[-1]
+    recommended_device = _select_take_up_device(required_travel, max_tension_lb)
 
     # Determine placement level (typically at mid-height or Level 3)
     num_floors = len(floor_assemblies)
@@ -266,44 +450,139 @@ def analyze_rod_run_shrinkage(
     )
 
 
-def print_shrinkage_analysis(result: ShrinkageAnalysisResult, rod_run_id: str = "RR-A-01"):
-    """Print formatted shrinkage analysis results."""
-    print("\n" + "=" * 70)
-    print(f"SHRINKAGE ANALYSIS RESULTS: {rod_run_id}")
-    print("=" * 70)
+@njit(parallel=True, cache=True)
+def _sweep_kernel(depths, plate_shrink, avg_coeff, delta_mc, num_floors,
+                  first_joist_level, rod_elongation, safety_factor,
+                  total_shrinkage, net_movement, required_travel):
+    """
+    Joist depth sweep, one depth per parallel iteration.
 
-    print("\nFloor-by-Floor Shrinkage:")
-    print("-" * 70)
-    print(f"{'Level':<8}{'Top Plate':<14}{'Bottom Plate':<14}{'Joist':<12}{'Total'}")
-    print("-" * 70)
+    plate_shrink is the combined top and bottom plate shrinkage of a
+    floor; levels below first_joist_level have plates but no joist.
+    Floors are summed top down, as analyze_rod_run_shrinkage sums them.
+    Writes the three output arrays.
+    """
+    for k in prange(depths.shape[0]):
+        joist = depths[k] * avg_coeff * delta_mc
+        joist = joist if joist > 0.0 else 0.0
 
-    for fd in sorted(result.floor_details, key=lambda x: x['level'], reverse=True):
-        print(f"{int(fd['level']):<8}{fd['top_plate_in']:>10.4f}\"{fd['bottom_plate_in']:>12.4f}\"{fd['joist_in']:>10.4f}\"{fd['total_in']:>10.4f}\"")
+        total = 0.0
+        for level in range(num_floors, 0, -1):
+            total += plate_shrink + (joist if level >= first_joist_level else 0.0)
 
-    print("-" * 70)
-    print(f"{'TOTAL':<8}{'':<14}{'':<14}{'':<12}{result.total_shrinkage_in:>10.4f}\"")
+        net = total - rod_elongation
+        travel = net * safety_factor
+        total_shrinkage[k] = total
+        net_movement[k] = net
+        required_travel[k] = travel if travel > 0.0 else 0.0
 
-    print("\n" + "-" * 70)
-    print("Movement Summary:")
-    print("-" * 70)
-    print(f"Total Wood Shrinkage:     {result.total_shrinkage_in:>8.4f}\"")
-    print(f"Rod Elongation:           {result.rod_elongation_in:>8.4f}\"")
-    print(f"Net Movement:             {result.net_movement_in:>8.4f}\"")
-    print(f"Required Travel (×1.25):  {result.required_travel_in:>8.4f}\"")
 
-    print("\n" + "-" * 70)
-    print("Take-Up Device Recommendation:")
-    print("-" * 70)
+def sweep_joist_depth_shrinkage(
+    joist_depths: List[float],
+    num_floors: int,
+    species: WoodSpecies,
+    rod_diameter_in: float,
+    rod_length_ft: float,
+    max_tension_lb: float,
+    top_plate_depth_in: float = 3.0,
+    bottom_plate_depth_in: float = 1.5,
+    safety_factor: float = 1.25,
+    slab_on_grade: bool = True
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shrinkage sensitivity to joist depth, computed for all depths at
+    once (in parallel with numba).
+
+    Each depth describes a rod run through num_floors identical floors
+    with the given plates and joists, at the default moisture content
+    change. With slab_on_grade (the default) level 1 bears on a slab and
+    has no joist; otherwise every level has one. Returns total
+    shrinkage, net movement and required travel arrays, matching
+    analyze_rod_run_shrinkage for the same assemblies.
+    """
+    tangential_coeff, radial_coeff = _SPECIES_COEFFS[species.index]
+    avg_coeff = (tangential_coeff + radial_coeff) / 2
+    delta_mc = _DEFAULT_DELTA_MC
+
+    plate_shrink = (
+        max(0.0, top_plate_depth_in * avg_coeff * delta_mc) +
+        max(0.0, bottom_plate_depth_in * avg_coeff * delta_mc)
+    )
+    rod_elongation = compute_rod_elongation(
+        max_tension_lb, rod_length_ft * 12, rod_diameter_in
+    )
+
+    depths = np.ascontiguousarray(joist_depths, dtype=np.float64)
+    total_shrinkage = np.empty_like(depths)
+    net_movement = np.empty_like(depths)
+    required_travel = np.empty_like(depths)
+    _sweep_kernel(
+        depths, plate_shrink, avg_coeff, delta_mc, num_floors,
+        2 if slab_on_grade else 1, rod_elongation, safety_factor,
+        total_shrinkage, net_movement, required_travel
+    )
+
+    return total_shrinkage, net_movement, required_travel
+
+
+# Floor table templates, parsed once
+_FLOOR_HEADER = (
+    f"{'Level':<8}{'Top Plate':<14}{'Bottom Plate':<14}{'Joist':<12}{'Total'}\n"
+)
+_FLOOR_ROW = "{0:<8d}{1:>10.4f}\"{2:>12.4f}\"{3:>10.4f}\"{4:>10.4f}\"\n"
+
+
+def print_shrinkage_analysis(
+    result: ShrinkageAnalysisResult,
+    rod_run_id: str = "RR-A-01",
+    out: Optional[TextIO] = None
+):
+    """
+    Print formatted shrinkage analysis results.
+
+    The report is built in memory and written to out (default
+    sys.stdout) in a single call.
+    """
+    buf = io.StringIO()
+
+    print("\n" + "=" * 70, file=buf)
+    print(f"SHRINKAGE ANALYSIS RESULTS: {rod_run_id}", file=buf)
+    print("=" * 70, file=buf)
+
+    print("\nFloor-by-Floor Shrinkage:", file=buf)
+    print("-" * 70, file=buf)
+    buf.write(_FLOOR_HEADER)
+    print("-" * 70, file=buf)
+
+    floors = sorted(result.floor_details.rows(), key=lambda x: x[0], reverse=True)
+    buf.write("".join([_FLOOR_ROW.format(*row) for row in floors]))
+
+    print("-" * 70, file=buf)
+    print(f"{'TOTAL':<8}{'':<14}{'':<14}{'':<12}{result.total_shrinkage_in:>10.4f}\"", file=buf)
+
+    print("\n" + "-" * 70, file=buf)
+    print("Movement Summary:", file=buf)
+    print("-" * 70, file=buf)
+    print(f"Total Wood Shrinkage:     {result.total_shrinkage_in:>8.4f}\"", file=buf)
+    print(f"Rod Elongation:           {result.rod_elongation_in:>8.4f}\"", file=buf)
+    print(f"Net Movement:             {result.net_movement_in:>8.4f}\"", file=buf)
+    print(f"Required Travel (×1.25):  {result.required_travel_in:>8.4f}\"", file=buf)
+
+    print("\n" + "-" * 70, file=buf)
+    print("Take-Up Device Recommendation:", file=buf)
+    print("-" * 70, file=buf)
     dev = result.recommended_device
-    print(f"Model:            {dev.model}")
-    print(f"Manufacturer:     {dev.manufacturer}")
-    print(f"Travel Capacity:  {dev.travel_capacity_in:.2f}\"")
-    print(f"Allowable Load:   {dev.allowable_load_lb:,} lb")
-    print(f"Placement:        Level {result.placement_level}")
+    print(f"Model:            {dev.model}", file=buf)
+    print(f"Manufacturer:     {dev.manufacturer}", file=buf)
+    print(f"Travel Capacity:  {dev.travel_capacity_in:.2f}\"", file=buf)
+    print(f"Allowable Load:   {dev.allowable_load_lb:,} lb", file=buf)
+    print(f"Placement:        Level {result.placement_level}", file=buf)
 
     margin = dev.travel_capacity_in - result.required_travel_in
-    print(f"Travel Margin:    {margin:.3f}\" ({margin/dev.travel_capacity_in*100:.1f}%)")
-    print()
+    print(f"Travel Margin:    {margin:.3f}\" ({margin/dev.travel_capacity_in*100:.1f}%)", file=buf)
+    print(file=buf)
+
+    (out or sys.stdout).write(buf.getvalue())
 
 
 # Example usage
@@ -393,26 +672,21 @@ if __name__ == "__main__":
     print(f"\n{'Joist Depth':<14}{'Total Shrink':<16}{'Net Movement':<16}{'Required Device'}")
     print("-" * 70)
 
-    for depth in joist_depths:
-        test_assemblies = [
-            FloorAssembly(
-                level=i,
-                top_plate_depth_in=3.0,
-                bottom_plate_depth_in=1.5,
-                joist_depth_in=depth if i > 1 else 0,
-                rim_depth_in=depth if i > 1 else 0,
-                species=WoodSpecies.DOUGLAS_FIR_LARCH
-            )
-            for i in range(5, 0, -1)
-        ]
-
-        test_result = analyze_rod_run_shrinkage(
-            test_assemblies,
-            rod_diameter,
-            rod_length,
-            max_tension
-        )
-
-        print(f"{depth}\"{'':10}{test_result.total_shrinkage_in:.4f}\"{'':10}{test_result.net_movement_in:.4f}\"{'':10}{test_result.recommended_device.model}")
+    total_shrink, net_movement, required_travel = sweep_joist_depth_shrinkage(
+        joist_depths,
+        5,
+        WoodSpecies.DOUGLAS_FIR_LARCH,
+        rod_diameter,
+        rod_length,
+        max_tension
+    )
+
+    devices = _select_take_up_devices(required_travel, max_tension).tolist()
+
+    for depth, shrink, movement, device_idx in zip(
+        joist_depths, total_shrink, net_movement, devices
+    ):
+        device = TAKE_UP_DEVICES[device_idx]
+        print(f"{depth}\"{'':10}{shrink:.4f}\"{'':10}{movement:.4f}\"{'':10}{device.model}")
 
     print()
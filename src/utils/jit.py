@@ -0,0 +1,100 @@
+"""
+CTR System - Optional JIT Compilation
+
+Numba is an optional accelerator for the numeric kernels. It is imported
+when a kernel is first called, not when the module defining the kernel
+is imported, so scripts that never reach a kernel skip numba's import
+time. When numba is not installed, njit returns the undecorated function
+and prange behaves as range, so every kernel still runs (more slowly)
+under the interpreter.
+"""
+
+import importlib.util
+import types
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def prange(*args):
+    """range under the interpreter; numba.prange in compiled kernels."""
+    return range(*args)
+
+
+def _resolve_globals(func):
+    """
+    Copy of func for numba to compile, with prange bound to numba.prange
+    and lazily compiled kernels bound to their numba dispatchers.
+    """
+    import numba
+
+    namespace = dict(func.__globals__)
+    for name in func.__code__.co_names:
+        value = namespace.get(name)
+        if value is prange:
+            namespace[name] = numba.prange
+        elif isinstance(value, _LazyKernel):
+            namespace[name] = value.dispatcher()
+
+    resolved = types.FunctionType(
+        func.__code__, namespace, func.__name__,
+        func.__defaults__, func.__closure__
+    )
+    resolved.__qualname__ = func.__qualname__
+    resolved.__kwdefaults__ = func.__kwdefaults__
+    resolved.__doc__ = func.__doc__
+    return resolved
+
+
+class _LazyKernel:
+    """
+    A kernel that imports numba and creates its dispatcher on first use.
+
+    Compilation itself stays lazy as with a plain numba.njit: the
+    dispatcher compiles (or loads from cache) on its first call.
+    """
+
+    def __init__(self, func, options):
+        self._func = func
+        self._options = options
+        self._dispatcher = None
+        self.__name__ = func.__name__
+        self.__qualname__ = func.__qualname__
+        self.__module__ = func.__module__
+        self.__doc__ = func.__doc__
+
+    @property
+    def py_func(self):
+        """The Python function as numba compiles it (for AOT builds)."""
+        return _resolve_globals(self._func)
+
+    def dispatcher(self):
+        """The numba dispatcher, created on the first call."""
+        if self._dispatcher is None:
+            import numba
+            self._dispatcher = numba.njit(**self._options)(self.py_func)
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs):
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            dispatcher = self.dispatcher()
+        return dispatcher(*args, **kwargs)
+
+
+def njit(*args, **kwargs):
+    """
+    Stand-in for numba.njit (bare or with options) that defers importing
+    numba until the kernel is first called.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return njit()(args[0])
+
+    def decorator(func):
+        if not NUMBA_AVAILABLE:
+            return func
+        return _LazyKernel(func, kwargs)
+
+    return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]